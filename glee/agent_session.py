@@ -5,15 +5,20 @@ Since CLI agents are stateless, Glee stores conversation history
 and injects it on resume.
 """
 
-import json
+import os
+import tempfile
+import threading
 import uuid
+from collections import OrderedDict
 from datetime import datetime
 from pathlib import Path
-from typing import NotRequired, TypedDict
+from typing import Any, NotRequired, TypedDict, cast
+
+import orjson
 
 
 class Message(TypedDict):
-    """A message in a session."""
+    """A message in a session (treated as immutable once recorded)."""
 
     role: str  # "user" or "assistant"
     content: str
@@ -32,6 +37,44 @@ class Session(TypedDict):
     messages: list[Message]
 
 
+class SessionHeader(TypedDict):
+    """Session fields kept in the sidecar index (everything but messages)."""
+
+    session_id: str
+    agent_name: NotRequired[str | None]
+    agent_cli: str
+    description: str
+    created_at: str
+    updated_at: str
+    status: str
+
+
+# (mtime_ns, size) of a session file followed by that of its journal
+# ((0, 0) when there is none); any write to either changes the stamp
+SessionStamp = tuple[int, int, int, int]
+
+# Recently loaded/saved sessions: path -> (stamp, session)
+_SESSION_CACHE_SIZE = 128
+_session_cache: OrderedDict[Path, tuple[SessionStamp, Session]] = OrderedDict()
+# MCP handlers reach the cache from worker threads; cached sessions themselves
+# are never mutated, so only the OrderedDict operations need the lock
+_session_cache_lock = threading.Lock()
+
+# Sidecar index of session headers, keyed by session ID. Each entry records
+# the session's stamp so stale entries are detected and only changed
+# sessions are re-parsed.
+_INDEX_FILE = ".index.json"
+
+# Append-only journal next to each session file (<session_id>.journal): one
+# JSON event per line for changes made since the session file was last
+# written, so adding a message doesn't rewrite the whole history. Folded back
+# into the session file once it outgrows it, which keeps rewrites amortized
+# linear in the bytes appended. Each event records the index of the message it
+# adds, so replaying a journal over a session file that already contains it
+# (a reader racing compaction) is a no-op.
+_JOURNAL_SUFFIX = ".journal"
+
+
 def get_sessions_dir(project_path: str | Path) -> Path:
     """Get the subagent sessions directory for a project."""
     sessions_dir = Path(project_path) / ".glee" / "agent_sessions"
@@ -75,73 +118,282 @@ def create_session(
         "messages": [{"role": "user", "content": initial_prompt}],
     }
 
-    save_session(project_path, session)
+    # Already stamped: write as is so created_at == updated_at
+    _write_session(project_path, session)
+    return session
+
+
+def _copy_session(session: Session) -> Session:
+    """Copy a session so callers can't mutate a cached one.
+
+    Only the session dict and its messages list are copied. Message dicts
+    are shared: once recorded, a message is never edited in place (sessions
+    only ever append), so copying them would be O(history) allocations for
+    nothing on every load.
+    """
+    copy = cast(Session, dict(session))
+    if "messages" in copy:
+        copy["messages"] = list(copy["messages"])
+    return copy
+
+
+def _session_stamp(session_file: Path) -> SessionStamp | None:
+    """Stat a session file and its journal, or None if the session is missing."""
+    try:
+        st = session_file.stat()
+    except OSError:
+        return None
+    try:
+        jst = session_file.with_suffix(_JOURNAL_SUFFIX).stat()
+    except OSError:
+        return (st.st_mtime_ns, st.st_size, 0, 0)
+    return (st.st_mtime_ns, st.st_size, jst.st_mtime_ns, jst.st_size)
+
+
+def _apply_event(session: Session, event: Any) -> None:
+    """Apply one journal event to a session in place."""
+    if not isinstance(event, dict):
+        return
+    event = cast(dict[str, Any], event)
+    message = event.get("message")
+    if isinstance(message, dict):
+        messages = session.setdefault("messages", [])
+        index = event.get("index")
+        if isinstance(index, int) and index < len(messages):
+            return  # Already folded into the session file
+        messages.append(cast(Message, message))
+    if "status" in event:
+        session["status"] = event["status"]
+    if "updated_at" in event:
+        session["updated_at"] = event["updated_at"]
+
+
+def _read_session_file(session_file: Path) -> Session | None:
+    """Read a session file and replay its journal (if any) on top."""
+    try:
+        data = orjson.loads(session_file.read_bytes())
+    except (orjson.JSONDecodeError, OSError):
+        return None
+    if not isinstance(data, dict):
+        return None
+    session = cast(Session, data)
+    try:
+        journal = session_file.with_suffix(_JOURNAL_SUFFIX).read_bytes()
+    except OSError:
+        return session
+    for line in journal.splitlines():
+        try:
+            _apply_event(session, orjson.loads(line))
+        except orjson.JSONDecodeError:
+            continue  # Torn last line from an interrupted append
     return session
 
 
+def _cache_session(session_file: Path, session: Session) -> None:
+    """Remember a session as just read from / written to session_file."""
+    stamp = _session_stamp(session_file)
+    if stamp is None:
+        return
+    entry = (stamp, _copy_session(session))
+    with _session_cache_lock:
+        _session_cache[session_file] = entry
+        _session_cache.move_to_end(session_file)
+        if len(_session_cache) > _SESSION_CACHE_SIZE:
+            _session_cache.popitem(last=False)
+
+
 def load_session(project_path: str | Path, session_id: str) -> Session | None:
-    """Load an existing session."""
+    """Load an existing session.
+
+    Recently used sessions are served from an in-process cache while their
+    file and journal are unchanged (same mtime and size), e.g. across the
+    load/save round trips of a resumed glee_task.
+    """
     sessions_dir = get_sessions_dir(project_path)
     session_file = sessions_dir / f"{session_id}.json"
 
-    if not session_file.exists():
+    stamp = _session_stamp(session_file)
+    if stamp is None:
         return None
 
-    try:
-        with open(session_file) as f:
-            return json.load(f)
-    except (json.JSONDecodeError, OSError):
-        return None
+    with _session_cache_lock:
+        cached = _session_cache.get(session_file)
+        if cached is not None and cached[0] == stamp:
+            _session_cache.move_to_end(session_file)
+        else:
+            cached = None
+    if cached is not None:
+        return _copy_session(cached[1])
+
+    session = _read_session_file(session_file)
+    if session is not None:
+        _cache_session(session_file, session)
+    return session
 
 
 def load_all_sessions(project_path: str | Path) -> list[Session]:
     """Load all sessions, sorted by updated_at (newest first)."""
     project_path = Path(project_path)
     sessions_dir = project_path / ".glee" / "agent_sessions"
-    if not sessions_dir.exists():
+    try:
+        with os.scandir(sessions_dir) as it:
+            session_files = [
+                e.path for e in it
+                if e.name.endswith(".json") and not e.name.startswith(".") and e.is_file()
+            ]
+    except OSError:
         return []
 
     sessions: list[Session] = []
-    for session_file in sessions_dir.glob("*.json"):
-        try:
-            with open(session_file) as f:
-                data = json.load(f)
-            if isinstance(data, dict):
-                sessions.append(data)  # type: ignore[arg-type]
-        except (json.JSONDecodeError, OSError):
-            continue
+    for session_file in session_files:
+        session = _read_session_file(Path(session_file))
+        if session is not None:
+            sessions.append(session)
 
     # Sort by updated_at, newest first
-    def parse_time(value: str | None) -> datetime:
-        if not value:
-            return datetime.min
+    sessions.sort(key=_updated_at_key, reverse=True)
+    return sessions
+
+
+def _updated_at_key(session: Session | SessionHeader) -> datetime:
+    """Sort key: the session's updated_at (datetime.min if missing/invalid)."""
+    value = session.get("updated_at")
+    if not value:
+        return datetime.min
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return datetime.min
+
+
+def load_session_index(project_path: str | Path) -> list[SessionHeader]:
+    """Load all session headers (no messages), sorted by updated_at (newest first).
+
+    Served from the sidecar index: only session files that are new or changed
+    since the index was last written get parsed, so listing costs one stat per
+    session rather than reading every file. The index is reconciled against
+    the directory on every call, so sessions written by other processes (or
+    older versions) are picked up.
+    """
+    sessions_dir = Path(project_path) / ".glee" / "agent_sessions"
+    files: dict[str, tuple[str, os.stat_result]] = {}
+    journals: dict[str, os.stat_result] = {}
+    try:
+        with os.scandir(sessions_dir) as it:
+            for e in it:
+                if e.name.startswith(".") or not e.is_file():
+                    continue
+                if e.name.endswith(".json"):
+                    files[e.name[:-5]] = (e.path, e.stat())
+                elif e.name.endswith(_JOURNAL_SUFFIX):
+                    journals[e.name[: -len(_JOURNAL_SUFFIX)]] = e.stat()
+    except OSError:
+        return []
+
+    index_path = sessions_dir / _INDEX_FILE
+    try:
+        raw: Any = orjson.loads(index_path.read_bytes())
+    except (orjson.JSONDecodeError, OSError):
+        raw = None
+    index = cast(dict[str, Any], raw) if isinstance(raw, dict) else {}
+
+    fresh: dict[str, Any] = {}
+    changed = index.keys() != files.keys()
+    for session_id, (path, st) in files.items():
+        jst = journals.get(session_id)
+        stamp = [st.st_mtime_ns, st.st_size, jst.st_mtime_ns if jst else 0, jst.st_size if jst else 0]
+        entry: Any = index.get(session_id)
+        if not isinstance(entry, dict) or cast(dict[str, Any], entry).get("stamp") != stamp:
+            data = _read_session_file(Path(path))
+            if data is None:
+                continue
+            data = cast(dict[str, Any], data)
+            data.pop("messages", None)
+            entry = {"stamp": stamp, "header": data}
+            changed = True
+        fresh[session_id] = entry
+
+    if changed:
         try:
-            return datetime.fromisoformat(value)
-        except ValueError:
-            return datetime.min
+            _write_atomic(index_path, orjson.dumps(fresh))
+        except OSError:
+            pass  # Index is a cache only
 
-    sessions.sort(key=lambda s: parse_time(s.get("updated_at")), reverse=True)
-    return sessions
+    headers: list[SessionHeader] = [entry["header"] for entry in fresh.values()]
+    headers.sort(key=_updated_at_key, reverse=True)
+    return headers
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    """Write a file via a temp file and rename, so readers never see it half-written.
+
+    The temp file is unique per call (mkstemp), so concurrent writers, whether
+    other processes or worker threads in this one, never share it.
+    """
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f"{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
 
 
 def get_latest_session(project_path: str | Path) -> tuple[Session | None, str | None]:
     """Get the most recent session and its ID."""
-    sessions = load_all_sessions(project_path)
-    if not sessions:
+    headers = load_session_index(project_path)
+    if not headers:
         return None, None
-    session = sessions[0]
-    return session, session.get("session_id")
+    session_id = headers[0].get("session_id")
+    if not session_id:
+        return None, None
+    return load_session(project_path, session_id), session_id
 
 
 def save_session(project_path: str | Path, session: Session) -> None:
-    """Save a session to disk."""
+    """Save a session to disk (folding in and removing any journal)."""
+    session["updated_at"] = datetime.now().isoformat()
+    _write_session(project_path, session)
+
+
+def _write_session(project_path: str | Path, session: Session) -> None:
+    """Write a session file as is, then drop its (now folded-in) journal."""
     sessions_dir = get_sessions_dir(project_path)
     session_file = sessions_dir / f"{session['session_id']}.json"
 
-    session["updated_at"] = datetime.now().isoformat()
+    _write_atomic(session_file, orjson.dumps(session, option=orjson.OPT_INDENT_2))
+    session_file.with_suffix(_JOURNAL_SUFFIX).unlink(missing_ok=True)
+    _cache_session(session_file, session)
+
 
-    with open(session_file, "w") as f:
-        json.dump(session, f, indent=2)
+def _append_event(project_path: str | Path, session: Session, event: dict[str, Any]) -> None:
+    """Record a change already applied to session by appending it to the journal.
+
+    Falls back to a full save_session (compaction) once the journal has grown
+    as large as the session file itself.
+    """
+    sessions_dir = get_sessions_dir(project_path)
+    session_file = sessions_dir / f"{session['session_id']}.json"
+    stamp = _session_stamp(session_file)
+    if stamp is None or stamp[3] >= stamp[1]:
+        save_session(project_path, session)
+        return
+
+    session["updated_at"] = event["updated_at"] = datetime.now().isoformat()
+    line = orjson.dumps(event) + b"\n"
+    with open(session_file.with_suffix(_JOURNAL_SUFFIX), "a+b") as f:
+        # Start on a fresh line if an earlier append was torn mid-line, so the
+        # torn fragment doesn't swallow this event too
+        if f.seek(0, os.SEEK_END) > 0:
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) != b"\n":
+                line = b"\n" + line
+        f.write(line)
+    _cache_session(session_file, session)
 
 
 def add_message(
@@ -155,8 +407,9 @@ def add_message(
     if not session:
         return None
 
-    session["messages"].append({"role": role, "content": content})
-    save_session(project_path, session)
+    message: Message = {"role": role, "content": content}
+    session["messages"].append(message)
+    _append_event(project_path, session, {"index": len(session["messages"]) - 1, "message": message})
     return session
 
 
@@ -188,7 +441,12 @@ def complete_session(
     if not session:
         return None
 
-    session["messages"].append({"role": "assistant", "content": output})
+    message: Message = {"role": "assistant", "content": output}
+    session["messages"].append(message)
     session["status"] = status
-    save_session(project_path, session)
+    _append_event(
+        project_path,
+        session,
+        {"index": len(session["messages"]) - 1, "message": message, "status": status},
+    )
     return session
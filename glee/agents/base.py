@@ -34,14 +34,25 @@ class BaseAgent(ABC):
     command: str
     capabilities: list[str]
 
+    # Seconds an is_available() probe is trusted before re-checking PATH
+    _AVAILABILITY_TTL = 30.0
+
     def __init__(self, project_path: Path | None = None):
         self._available: bool | None = None
+        self._available_checked_at = 0.0
         self.project_path = project_path
 
     def is_available(self) -> bool:
-        """Check if the agent CLI is installed and available."""
-        if self._available is None:
+        """Check if the agent CLI is installed and available.
+
+        The PATH lookup is cached for _AVAILABILITY_TTL seconds, so status
+        polling stays cheap while a long-running server still notices a CLI
+        being installed or removed.
+        """
+        now = time.monotonic()
+        if self._available is None or now - self._available_checked_at >= self._AVAILABILITY_TTL:
             self._available = shutil.which(self.command) is not None
+            self._available_checked_at = now
         return self._available
 
     def get_version(self) -> str | None:
@@ -232,13 +243,18 @@ class BaseAgent(ABC):
         output_lines: list[str] = []
         error_lines: list[str] = []
 
-        # Write to log file helper (daily rotation)
+        # Log file per stream type, resolved once per run (daily rotation)
+        log_paths: dict[str, Path] = {}
+
+        # Write to log file helper
         def write_to_log(stream_type: str, line: str) -> None:
             if self.project_path:
-                log_dir = self.project_path / ".glee" / "stream_logs"
-                log_dir.mkdir(parents=True, exist_ok=True)
-                date_str = datetime.now().strftime("%Y%m%d")
-                log_path = log_dir / f"{stream_type}-{date_str}.log"
+                log_path = log_paths.get(stream_type)
+                if log_path is None:
+                    log_dir = self.project_path / ".glee" / "stream_logs"
+                    log_dir.mkdir(parents=True, exist_ok=True)
+                    date_str = datetime.now().strftime("%Y%m%d")
+                    log_path = log_paths[stream_type] = log_dir / f"{stream_type}-{date_str}.log"
                 try:
                     with open(log_path, "a") as f:
                         f.write(line)
@@ -1,12 +1,25 @@
 """Codex CLI agent adapter."""
 
-import json
-from typing import Any
+from collections.abc import Iterator
+from typing import Any, cast
+
+import orjson
 
 from .base import AgentResult, BaseAgent
 from .prompts import code_prompt, judge_prompt, process_feedback_prompt, review_prompt
 
 
+def _iter_lines_reversed(text: str) -> Iterator[str]:
+    """Yield the non-empty, stripped lines of text, last line first."""
+    end = len(text)
+    while end > 0:
+        start = text.rfind("\n", 0, end)
+        line = text[start + 1 : end].strip()
+        if line:
+            yield line
+        end = start
+
+
 class CodexAgent(BaseAgent):
     """Wrapper for Codex CLI."""
 
@@ -44,39 +57,43 @@ class CodexAgent(BaseAgent):
         else:
             result = self._run_subprocess(args, prompt=prompt, timeout=timeout)
 
-        # Parse JSON output if available
+        # Replace raw JSONL with the final agent message if available
         if result.success and result.output:
             try:
-                parsed = self._parse_jsonl(result.output)
-                result.metadata["parsed"] = parsed
-
-                # Extract the final agent message
-                for item in reversed(parsed):
-                    # Handle item.completed with agent_message
-                    if item.get("type") == "item.completed":
-                        inner = item.get("item", {})
-                        if inner.get("type") == "agent_message" and inner.get("text"):
-                            result.output = inner["text"]
-                            break
-                    # Handle direct message type
-                    elif item.get("type") == "message" and item.get("content"):
-                        result.output = item["content"]
-                        break
+                message = self._final_message(result.output)
+                if message:
+                    result.output = message
             except Exception:
                 pass  # Keep raw output if parsing fails
 
         return result
 
-    def _parse_jsonl(self, output: str) -> list[dict[str, Any]]:
-        """Parse JSONL output from Codex."""
-        results: list[dict[str, Any]] = []
-        for line in output.strip().split("\n"):
-            if line.strip():
-                try:
-                    results.append(json.loads(line))
-                except json.JSONDecodeError:
-                    pass
-        return results
+    def _final_message(self, output: str) -> str | None:
+        """Find the final agent message in Codex JSONL output.
+
+        Scans lines from the end and stops at the first message, so only the
+        tail of a long transcript is parsed.
+        """
+        for line in _iter_lines_reversed(output):
+            try:
+                raw: Any = orjson.loads(line)
+            except orjson.JSONDecodeError:
+                continue
+            if not isinstance(raw, dict):
+                continue
+            item = cast(dict[str, Any], raw)
+            # Handle item.completed with agent_message
+            if item.get("type") == "item.completed":
+                inner: Any = item.get("item")
+                if not isinstance(inner, dict):
+                    continue
+                inner = cast(dict[str, Any], inner)
+                if inner.get("type") == "agent_message" and inner.get("text"):
+                    return inner["text"]
+            # Handle direct message type
+            elif item.get("type") == "message" and item.get("content"):
+                return item["content"]
+        return None
 
     def run_review(
         self,
@@ -2,10 +2,10 @@
 
 from __future__ import annotations
 
-import json
 from pathlib import Path
 from typing import Any, TypedDict
 
+import orjson
 
 class ConversationMessage(TypedDict):
     """A message in a conversation."""
@@ -26,7 +26,10 @@ class ConversationSummary(TypedDict):
 
 
 def get_claude_projects_dir() -> Path:
-    """Get the Claude Code projects directory."""
+    """Get the Claude Code projects directory.
+
+    Resolved per call (cheap) so HOME changes after import are honored.
+    """
     return Path.home() / ".claude" / "projects"
 
 
@@ -54,15 +57,12 @@ def get_claude_session_file(
     Returns:
         Path to the session .jsonl file, or None if not found
     """
-    claude_projects = get_claude_projects_dir()
     project_folder = project_path_to_claude_folder(project_path)
-    session_dir = claude_projects / project_folder
-
-    if not session_dir.exists():
-        return None
+    session_file = get_claude_projects_dir() / project_folder / f"{session_id}.jsonl"
 
-    session_file = session_dir / f"{session_id}.jsonl"
-    if session_file.exists():
+    # One stat answers both "does the project folder exist" and "is the
+    # session there"
+    if session_file.is_file():
         return session_file
 
     return None
@@ -87,8 +87,8 @@ def parse_claude_session(session_file: Path) -> ConversationSummary | None:
                     continue
 
                 try:
-                    obj = json.loads(line)
-                except json.JSONDecodeError:
+                    obj = orjson.loads(line)
+                except orjson.JSONDecodeError:
                     continue
 
                 msg_type = obj.get("type")
@@ -2,6 +2,7 @@
 
 import json
 import os
+import re
 from pathlib import Path
 from typing import Any, cast
 
@@ -14,6 +15,20 @@ from rich.tree import Tree
 
 from .theme import Theme, console
 
+# Reviewer verdict marker, matched case-insensitively without copying the output
+_NEEDS_CHANGES_RE = re.compile("NEEDS_CHANGES", re.IGNORECASE)
+
+# Issue severity tags emitted by reviewers ([HIGH] / [MEDIUM] / [LOW])
+_SEVERITY_TAG_RE = re.compile(r"\[(?:HIGH|MEDIUM|LOW)\]", re.IGNORECASE)
+
+# GitHub review targets: github:pr#123, github:owner/repo#123, github:branch/feature
+_GITHUB_PR_TARGET_RE = re.compile(r"github:(?:pr|([^/]+)/([^#]+))?#?(\d+)")
+_GITHUB_BRANCH_TARGET_RE = re.compile(r"github:branch/(.+)")
+
+# origin remote URLs: git@github.com:owner/repo.git, https://github.com/owner/repo.git
+_GITHUB_SSH_URL_RE = re.compile(r"git@github\.com:([^/]+)/(.+?)(?:\.git)?$")
+_GITHUB_HTTPS_URL_RE = re.compile(r"https://github\.com/([^/]+)/(.+?)(?:\.git)?$")
+
 
 def _parse_github_target(target: str) -> tuple[str, str | None, str | None, int | None]:
     """Parse GitHub target string.
@@ -25,10 +40,8 @@ def _parse_github_target(target: str) -> tuple[str, str | None, str | None, int
         Tuple of (type, owner, repo, number_or_branch)
         type is 'pr' or 'branch'
     """
-    import re
-
     # github:pr#123 or github:owner/repo#123
-    pr_match = re.match(r"github:(?:([^/]+)/([^#]+))?#?(\d+)", target)
+    pr_match = _GITHUB_PR_TARGET_RE.match(target)
     if pr_match:
         owner = pr_match.group(1)
         repo = pr_match.group(2)
@@ -36,7 +49,7 @@ def _parse_github_target(target: str) -> tuple[str, str | None, str | None, int
         return ("pr", owner, repo, number)
 
     # github:branch/feature
-    branch_match = re.match(r"github:branch/(.+)", target)
+    branch_match = _GITHUB_BRANCH_TARGET_RE.match(target)
     if branch_match:
         branch = branch_match.group(1)
         return ("branch", None, None, branch)  # type: ignore[return-value]
@@ -46,7 +59,6 @@ def _parse_github_target(target: str) -> tuple[str, str | None, str | None, int
 
 def _get_repo_info() -> tuple[str, str]:
     """Get owner/repo from git remote."""
-    import re
     import subprocess
 
     result = subprocess.run(
@@ -59,12 +71,12 @@ def _get_repo_info() -> tuple[str, str]:
 
     url = result.stdout.strip()
     # Handle SSH: git@github.com:owner/repo.git
-    ssh_match = re.match(r"git@github\.com:([^/]+)/(.+?)(?:\.git)?$", url)
+    ssh_match = _GITHUB_SSH_URL_RE.match(url)
     if ssh_match:
         return ssh_match.group(1), ssh_match.group(2)
 
     # Handle HTTPS: https://github.com/owner/repo.git
-    https_match = re.match(r"https://github\.com/([^/]+)/(.+?)(?:\.git)?$", url)
+    https_match = _GITHUB_HTTPS_URL_RE.match(url)
     if https_match:
         return https_match.group(1), https_match.group(2)
 
@@ -122,11 +134,7 @@ def _review_github(target: str, focus: str | None, dry_run: bool) -> None:
             console.print()
 
             # Format diff for review
-            diff_content: list[str] = []
-            for f in files:
-                diff_content.append(format_diff_for_review(f.filename, f.patch))
-
-            full_diff = "\n".join(diff_content)
+            full_diff = "\n".join([format_diff_for_review(f.filename, f.patch) for f in files])
 
             # Build review prompt
             focus_str = f"\nFocus on: {focus}" if focus else ""
@@ -155,8 +163,9 @@ End with either APPROVED or NEEDS_CHANGES."""
             console.print(f"[{Theme.INFO}]Running {reviewer_cli} review...[/{Theme.INFO}]")
             console.print()
 
-            # Run review (blocking)
-            result = agent.run(review_prompt, stream=True)
+            # Run review in a worker thread so the event loop (and the open
+            # GitHub client) isn't blocked for the length of the review
+            result = await asyncio.to_thread(agent.run, review_prompt, stream=True)
 
             if result.error:
                 console.print(f"[{Theme.ERROR}]Review failed: {result.error}[/{Theme.ERROR}]")
@@ -165,7 +174,8 @@ End with either APPROVED or NEEDS_CHANGES."""
             review_output = result.output
 
             # Save report to file
-            timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+            reviewed_at = datetime.now()
+            timestamp = reviewed_at.strftime("%Y%m%d-%H%M%S")
             report_dir = Path(".glee/reviews")
             report_dir.mkdir(parents=True, exist_ok=True)
             report_path = report_dir / f"pr-{pr_number}-{timestamp}.md"
@@ -175,7 +185,7 @@ End with either APPROVED or NEEDS_CHANGES."""
 **URL:** {pr.html_url}
 **Author:** {pr.user}
 **Branch:** {pr.head_ref} → {pr.base_ref}
-**Reviewed:** {datetime.now().isoformat()}
+**Reviewed:** {reviewed_at.isoformat()}
 **Reviewer:** {reviewer_cli}
 
 ---
@@ -186,7 +196,7 @@ End with either APPROVED or NEEDS_CHANGES."""
             console.print(f"[{Theme.MUTED}]Report saved: {report_path}[/{Theme.MUTED}]")
 
             # Count issues
-            issues_found = review_output.upper().count("[HIGH]") + review_output.upper().count("[MEDIUM]") + review_output.upper().count("[LOW]")
+            issues_found = len(_SEVERITY_TAG_RE.findall(review_output))
 
             # Add to open_loop memory for warmup injection
             try:
@@ -258,20 +268,21 @@ def code_review(
     from glee.agents import registry
     from glee.agents.base import AgentResult
     from glee.config import get_project_config
-    from glee.dispatch import get_primary_reviewer, get_secondary_reviewer
+    from glee.helpers import parse_focus
 
     config = get_project_config()
     if not config:
         console.print("[red]Project not initialized. Run 'glee init' first.[/red]")
         raise typer.Exit(1)
-    focus_list = [f.strip() for f in focus.split(",")] if focus else None
+    focus_list = parse_focus(focus)
 
-    # Get reviewers
-    primary = get_primary_reviewer()
+    # Get reviewers from the config already loaded (same defaults as glee.dispatch)
+    reviewers: dict[str, str] = config.get("reviewers", {"primary": "codex"})
+    primary = reviewers.get("primary", "codex")
     reviewers_to_run = [primary]
 
     if second_opinion:
-        secondary = get_secondary_reviewer()
+        secondary = reviewers.get("secondary")
         if secondary:
             reviewers_to_run.append(secondary)
         else:
@@ -296,8 +307,10 @@ def code_review(
 
     results: dict[str, dict[str, Any]] = {}
 
+    get_agent = registry.get
+
     def run_single_review(reviewer_cli: str) -> tuple[str, AgentResult | None, str | None]:
-        agent = registry.get(reviewer_cli)
+        agent = get_agent(reviewer_cli)
         if not agent:
             return reviewer_cli, None, f"CLI {reviewer_cli} not found in registry"
         if not agent.is_available():
@@ -331,7 +344,7 @@ def code_review(
                 summary_tree.add(f"[{Theme.ERROR}]✗[/{Theme.ERROR}] {reviewer_name}: [{Theme.ERROR}]Error[/{Theme.ERROR}]")
                 all_approved = False
             else:
-                if "NEEDS_CHANGES" in result.output.upper():
+                if _NEEDS_CHANGES_RE.search(result.output):
                     summary_tree.add(f"[{Theme.WARNING}]![/{Theme.WARNING}] {reviewer_name}: [{Theme.WARNING}]Changes requested[/{Theme.WARNING}]")
                     all_approved = False
                 else:
@@ -398,6 +411,7 @@ def summarize_session(
         parse_claude_session,
     )
     from glee.config import get_project_config
+    from glee.helpers import extract_json_object
     from glee.memory.capture import capture_memory
 
     # Set up logging to .glee/stream_logs/
@@ -558,9 +572,12 @@ If a field doesn't apply, use an empty string or empty array. Be concise."""
                 output = output.rsplit("```", 1)[0]
             output = output.strip()
 
+        # Models sometimes wrap the object in prose; parse the first balanced {...}
+        json_text = output if output.startswith("{") else (extract_json_object(output) or output)
+
         structured: dict[str, Any] = {}
         try:
-            parsed = json.loads(output)
+            parsed = json.loads(json_text)
             if not isinstance(parsed, dict):
                 log(f"JSON is not a dict (got {type(parsed).__name__}), using raw output")
                 console.print("[yellow]Response is not a JSON object, using raw output[/yellow]")
@@ -322,6 +322,8 @@ def connect_status():
     Examples:
         glee connect status
     """
+    import time
+
     from glee.connect import storage
 
     console.print(padded(Text.assemble(
@@ -335,10 +337,11 @@ def connect_status():
         return
 
     auth_tree = Tree(f"[{Theme.HEADER}]Credentials[/{Theme.HEADER}]")
+    now_ms = time.time() * 1000
 
     for c in creds:
         if isinstance(c, storage.AIProviderOAuthCredential):
-            status = f"[{Theme.WARNING}]expired[/{Theme.WARNING}]" if c.is_expired() else f"[{Theme.SUCCESS}]active[/{Theme.SUCCESS}]"
+            status = f"[{Theme.WARNING}]expired[/{Theme.WARNING}]" if c.is_expired(now_ms) else f"[{Theme.SUCCESS}]active[/{Theme.SUCCESS}]"
             branch = auth_tree.add(f"[{Theme.SUCCESS}]✓[/{Theme.SUCCESS}] {c.label} [{Theme.ACCENT}]oauth[/{Theme.ACCENT}] {status}")
             branch.add(f"[{Theme.MUTED}]id:[/{Theme.MUTED}] {c.id}")
             branch.add(f"[{Theme.MUTED}]vendor:[/{Theme.MUTED}] {c.vendor} [{Theme.ACCENT}]{c.sdk}[/{Theme.ACCENT}]")
@@ -19,13 +19,14 @@ logs_app = typer.Typer(help="Log management commands")
 def logs_show(
     level: str | None = typer.Option(None, "--level", "-l", help="Filter by level"),
     search: str | None = typer.Option(None, "--search", "-s", help="Search in message text"),
+    prefix: str | None = typer.Option(None, "--prefix", "-p", help="Only messages starting with this text"),
     limit: int = typer.Option(50, "--limit", "-n", help="Max results"),
 ):
     """Show recent logs."""
     from glee.logging import query_logs
 
     project_path = Path(os.getcwd())
-    results = query_logs(project_path, level=level, search=search, limit=limit)
+    results = query_logs(project_path, level=level, search=search, limit=limit, prefix=prefix)
 
     if not results:
         console.print(f"[{Theme.WARNING}]No logs found[/{Theme.WARNING}]")
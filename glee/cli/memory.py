@@ -441,18 +441,21 @@ def _generate_overview(project_path: Path, agent_name: str | None = None) -> Non
             return []
         tree_lines: list[str] = []
         try:
-            items = sorted(path.iterdir(), key=lambda x: (not x.is_dir(), x.name.lower()))
-            items = [i for i in items if not i.name.startswith(".") and i.name not in (
-                "node_modules", "__pycache__", ".git", "venv", ".venv", "dist", "build",
-                "target", ".pytest_cache", ".mypy_cache"
-            )]
+            # DirEntry carries the file type from the listing: no stat per entry
+            with os.scandir(path) as it:
+                items = [i for i in it if not i.name.startswith(".") and i.name not in (
+                    "node_modules", "__pycache__", ".git", "venv", ".venv", "dist", "build",
+                    "target", ".pytest_cache", ".mypy_cache"
+                )]
+            items.sort(key=lambda x: (not x.is_dir(), x.name.lower()))
             for i, item in enumerate(items[:20]):
                 is_last = i == len(items) - 1 or i == 19
                 connector = "└── " if is_last else "├── "
-                tree_lines.append(f"{prefix}{connector}{item.name}{'/' if item.is_dir() else ''}")
-                if item.is_dir():
+                is_dir = item.is_dir()
+                tree_lines.append(f"{prefix}{connector}{item.name}{'/' if is_dir else ''}")
+                if is_dir:
                     extension = "    " if is_last else "│   "
-                    tree_lines.extend(get_tree(item, prefix + extension, depth + 1))
+                    tree_lines.extend(get_tree(Path(item.path), prefix + extension, depth + 1))
         except PermissionError:
             pass
         return tree_lines
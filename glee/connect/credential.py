@@ -39,11 +39,18 @@ class AIProviderOAuthCredential:
     def category(self) -> Category:
         return "ai_provider"
 
-    def is_expired(self) -> bool:
-        """Check if the access token is expired."""
+    def is_expired(self, now_ms: float | None = None) -> bool:
+        """Check if the access token is expired.
+
+        Args:
+            now_ms: Current time in epoch milliseconds. Pass it when checking
+                many credentials so the clock is read once.
+        """
         if self.expires == 0:
             return False
-        return time.time() * 1000 > self.expires
+        if now_ms is None:
+            now_ms = time.time() * 1000
+        return now_ms > self.expires
 
     def to_dict(self) -> dict[str, Any]:
         d: dict[str, Any] = {
@@ -2,6 +2,10 @@
 
 Single file storage: ~/.config/glee/connections.yml
 
+The file is written as JSON, which is a YAML subset, so it keeps its .yml
+name and older readers still load it. Hand-written or legacy YAML files
+are read through libyaml as a fallback.
+
 ```yaml
 - id: a1b2c3d4e5
   label: codex
@@ -35,10 +39,16 @@ import os
 import secrets
 import string
 from pathlib import Path
-from typing import Any
+from typing import Any, cast
 
+import orjson
 import yaml
 
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader  # type: ignore[assignment]
+
 from glee.connect.credential import (
     SDK,
     AIProviderAPICredential,
@@ -90,6 +100,10 @@ def generate_id() -> str:
 # Storage path
 CONNECTIONS_PATH = Path.home() / ".config" / "glee" / "connections.yml"
 
+# Parsed file contents keyed by path, validated by (st_mtime_ns, st_size).
+# Each entry holds the raw list plus an id/label -> entry index.
+_parse_cache: dict[Path, tuple[int, int, list[dict[str, Any]], dict[str, dict[str, Any]]]] = {}
+
 
 class ConnectionStorage:
     """Storage for Glee connections (~/.config/glee/connections.yml)."""
@@ -108,11 +122,13 @@ class ConnectionStorage:
 
     @classmethod
     def get(cls, id_or_label: str) -> Credential | None:
-        """Get connection by ID or label (both are unique)."""
-        for cred in cls.all():
-            if cred.id == id_or_label or cred.label == id_or_label:
-                return cred
-        return None
+        """Get connection by ID or label (both are unique).
+
+        Matches the first entry that parses into a credential, like a scan of
+        all() would.
+        """
+        entry = cls._load()[1].get(id_or_label)
+        return cls.parse(entry) if entry else None
 
     @classmethod
     def add(cls, credential: Credential) -> Credential:
@@ -150,22 +166,60 @@ class ConnectionStorage:
 
     @classmethod
     def read(cls) -> list[dict[str, Any]]:
-        """Read all connections from file."""
-        if not cls.path.exists():
-            return []
+        """Read all connections from file.
+
+        The parsed list is cached until the file's mtime or size changes.
+        Callers get copies of the entries, so they can modify them freely.
+        """
+        return [dict(entry) for entry in cls._load()[0]]
+
+    @classmethod
+    def _load(cls) -> tuple[list[dict[str, Any]], dict[str, dict[str, Any]]]:
+        """Return cached (entries, id/label index), re-parsing only when the file changed.
+
+        The index only holds entries that parse into a credential. Both are
+        shared with the cache and must not be modified.
+        """
+        try:
+            st = os.stat(cls.path)
+        except OSError:
+            return [], {}
+
+        cached = _parse_cache.get(cls.path)
+        if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            return cached[2], cached[3]
+
+        data: Any
         try:
-            with open(cls.path) as f:
-                data = yaml.safe_load(f)
-                return data if isinstance(data, list) else []  # type: ignore[return-value]
+            raw = cls.path.read_bytes()
+            try:
+                data = orjson.loads(raw)
+            except orjson.JSONDecodeError:
+                # Legacy YAML file
+                data = yaml.load(raw, Loader=_SafeLoader)
         except Exception:
-            return []
+            return [], {}
+        items: list[Any] = cast(list[Any], data) if isinstance(data, list) else []
+        entries = [cast(dict[str, Any], e) for e in items if isinstance(e, dict)]
+
+        index: dict[str, dict[str, Any]] = {}
+        for entry in entries:
+            cred = cls.parse(entry)
+            if cred is None:
+                continue  # Unknown type: get() skips it, so the next match wins
+            for key in (cred.id, cred.label):
+                if key:
+                    index.setdefault(key, entry)
+
+        _parse_cache[cls.path] = (st.st_mtime_ns, st.st_size, entries, index)
+        return entries, index
 
     @classmethod
     def write(cls, data: list[dict[str, Any]]) -> None:
         """Write connections to file."""
+        _parse_cache.pop(cls.path, None)
         cls.path.parent.mkdir(parents=True, exist_ok=True)
-        with open(cls.path, "w") as f:
-            yaml.dump(data, f, default_flow_style=False, sort_keys=False)
+        cls.path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE))
         os.chmod(cls.path, 0o600)
 
     @staticmethod
@@ -1,5 +1,7 @@
 """DuckDB database connection and helpers."""
 
+import functools
+import os
 from pathlib import Path
 
 import duckdb
@@ -10,6 +12,12 @@ from .schema import DUCKDB_SCHEMAS
 DUCKDB_DB_NAME = "memory.duckdb"
 
 
+@functools.lru_cache(maxsize=8)
+def _default_duckdb_path(cwd: str) -> Path:
+    """Database path for a working directory, cached per cwd string."""
+    return Path(cwd) / ".glee" / DUCKDB_DB_NAME
+
+
 def get_duckdb_path(project_path: Path | None = None) -> Path:
     """Get the DuckDB database path.
 
@@ -20,7 +28,7 @@ def get_duckdb_path(project_path: Path | None = None) -> Path:
         Path to the DuckDB database file.
     """
     if project_path is None:
-        project_path = Path.cwd()
+        return _default_duckdb_path(os.getcwd())
     return project_path / ".glee" / DUCKDB_DB_NAME
 
 
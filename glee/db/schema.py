@@ -2,14 +2,14 @@
 
 SQLite (glee.db):
 - agent_logs: Agent invocation history
-- logs: General application logs
+- logs: General application logs (+ logs_fts full-text index)
 
 DuckDB (memory.duckdb):
 - memories: Stored memories with embeddings
 - stats: Key-value stats/metadata
 """
 
-from typing import TypedDict
+from typing import NotRequired, TypedDict
 
 
 class TableSchema(TypedDict):
@@ -17,6 +17,11 @@ class TableSchema(TypedDict):
 
     table: str
     indexes: list[str]
+    # Optional full-text index: DDL for an external-content FTS5 table and its
+    # sync triggers, plus the FTS table name (rebuilt from the base table when
+    # first created)
+    fts: NotRequired[list[str]]
+    fts_table: NotRequired[str]
 
 # =============================================================================
 # SQLite Schemas (glee.db)
@@ -45,7 +50,7 @@ AGENT_LOGS_INDEXES = [
 LOGS_TABLE = """
 CREATE TABLE IF NOT EXISTS logs (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
-    timestamp TEXT NOT NULL,
+    timestamp INTEGER NOT NULL,  -- Unix epoch microseconds
     level TEXT NOT NULL,
     message TEXT NOT NULL
 )
@@ -53,7 +58,39 @@ CREATE TABLE IF NOT EXISTS logs (
 
 LOGS_INDEXES = [
     "CREATE INDEX IF NOT EXISTS idx_logs_timestamp ON logs(timestamp)",
-    "CREATE INDEX IF NOT EXISTS idx_logs_level ON logs(level)",
+    # Level filters range-scan (level, timestamp) already in query_logs order;
+    # supersedes the level-only index of older databases
+    "DROP INDEX IF EXISTS idx_logs_level",
+    "CREATE INDEX IF NOT EXISTS idx_logs_level_ts ON logs(level, timestamp DESC)",
+    # Older databases had a NOCASE message index for prefix filters; it added
+    # write cost to every insert for no measured gain
+    "DROP INDEX IF EXISTS idx_logs_message_prefix",
+]
+
+# Trigram FTS5 index over logs.message: substring search (3+ chars) without
+# scanning the table. External content, kept in sync by triggers.
+LOGS_FTS = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS logs_fts USING fts5(
+        message, content='logs', content_rowid='id', tokenize='trigram'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS logs_fts_ai AFTER INSERT ON logs BEGIN
+        INSERT INTO logs_fts(rowid, message) VALUES (new.id, new.message);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS logs_fts_ad AFTER DELETE ON logs BEGIN
+        INSERT INTO logs_fts(logs_fts, rowid, message) VALUES ('delete', old.id, old.message);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS logs_fts_au AFTER UPDATE ON logs BEGIN
+        INSERT INTO logs_fts(logs_fts, rowid, message) VALUES ('delete', old.id, old.message);
+        INSERT INTO logs_fts(rowid, message) VALUES (new.id, new.message);
+    END
+    """,
 ]
 
 # All SQLite schemas
@@ -65,6 +102,8 @@ SQLITE_SCHEMAS: dict[str, TableSchema] = {
     "logs": {
         "table": LOGS_TABLE,
         "indexes": LOGS_INDEXES,
+        "fts": LOGS_FTS,
+        "fts_table": "logs_fts",
     },
 }
 
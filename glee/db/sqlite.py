@@ -1,10 +1,12 @@
 """SQLite database connection and helpers."""
 
+import functools
+import os
 import sqlite3
 import threading
 from pathlib import Path
 
-from .schema import SQLITE_SCHEMAS
+from .schema import LOGS_TABLE, SQLITE_SCHEMAS, TableSchema
 
 # Default database filename
 SQLITE_DB_NAME = "glee.db"
@@ -12,6 +14,23 @@ SQLITE_DB_NAME = "glee.db"
 # Thread-local storage for SQLite connections
 _thread_local = threading.local()
 
+# Applied to every new connection. WAL lets readers proceed while a writer
+# commits, and synchronous=NORMAL drops the per-commit fsync (WAL stays
+# consistent; only the last transactions can be lost on power failure).
+_CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-20000",
+    "PRAGMA busy_timeout=5000",
+)
+
+
+@functools.lru_cache(maxsize=8)
+def _default_sqlite_path(cwd: str) -> Path:
+    """Database path for a working directory, cached per cwd string."""
+    return Path(cwd) / ".glee" / SQLITE_DB_NAME
+
 
 def get_sqlite_path(project_path: Path | None = None) -> Path:
     """Get the SQLite database path.
@@ -23,7 +42,7 @@ def get_sqlite_path(project_path: Path | None = None) -> Path:
         Path to the SQLite database file.
     """
     if project_path is None:
-        project_path = Path.cwd()
+        return _default_sqlite_path(os.getcwd())
     return project_path / ".glee" / SQLITE_DB_NAME
 
 
@@ -49,7 +68,6 @@ def get_sqlite_connection(project_path: Path | None = None) -> sqlite3.Connectio
         SQLite connection object (thread-local).
     """
     db_path = get_sqlite_path(project_path)
-    db_path.parent.mkdir(parents=True, exist_ok=True)
     db_key = str(db_path)
 
     connections = _get_connection_cache()
@@ -65,8 +83,18 @@ def get_sqlite_connection(project_path: Path | None = None) -> sqlite3.Connectio
             # Connection was closed, remove from cache
             del connections[db_key]
 
-    # Create new connection for this thread
-    conn = sqlite3.connect(str(db_path))
+    # Create new connection for this thread (only then make sure .glee exists)
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(db_key, cached_statements=256)
+    for pragma in _CONNECTION_PRAGMAS:
+        conn.execute(pragma)
+    # Readers (e.g. `glee logs`) may open an old database before any writer
+    # has initialized it, so legacy data is migrated here, once per connection
+    try:
+        if _migrate_logs_timestamps(conn):
+            init_sqlite(conn, tables=["logs"])  # Restore indexes and FTS triggers
+    except sqlite3.OperationalError:
+        pass  # Database busy; retried by the next connection or init_sqlite
     connections[db_key] = conn
     return conn
 
@@ -80,6 +108,8 @@ def close_thread_connections() -> None:
         connections = _get_connection_cache()
         for conn in connections.values():
             try:
+                # Refresh planner statistics where they've drifted (cheap no-op otherwise)
+                conn.execute("PRAGMA optimize")
                 conn.close()
             except Exception:
                 pass
@@ -103,15 +133,85 @@ def init_sqlite(
         if table_name not in SQLITE_SCHEMAS:
             continue
 
+        if table_name == "logs":
+            _migrate_logs_timestamps(conn)
+
         schema = SQLITE_SCHEMAS[table_name]
         conn.execute(schema["table"])
 
         for index_sql in schema.get("indexes", []):
             conn.execute(index_sql)
 
+        if "fts" in schema:
+            _init_fts(conn, schema)
+
     conn.commit()
 
 
+def _logs_timestamp_type(conn: sqlite3.Connection) -> str:
+    """Declared type of logs.timestamp ('' if the table doesn't exist)."""
+    columns = {row[1]: row[2] for row in conn.execute("PRAGMA table_info(logs)")}
+    return columns.get("timestamp", "").upper()
+
+
+def _migrate_logs_timestamps(conn: sqlite3.Connection) -> bool:
+    """Convert a logs table with ISO-8601 TEXT timestamps to epoch microseconds.
+
+    The table is rebuilt with the same ids, so logs_fts stays valid; indexes
+    and triggers are recreated by init_sqlite afterwards. Old timestamps keep
+    millisecond precision (SQLite's julianday resolution); their UTC offsets
+    are honored.
+
+    Returns:
+        True if the table was rebuilt.
+    """
+    if _logs_timestamp_type(conn) != "TEXT":
+        return False
+
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        # Another connection may have migrated while we waited for the lock
+        migrated = _logs_timestamp_type(conn) == "TEXT"
+        if migrated:
+            conn.execute(LOGS_TABLE.replace(" logs (", " logs_new (", 1))
+            conn.execute(
+                """
+                INSERT INTO logs_new (id, timestamp, level, message)
+                SELECT id,
+                       COALESCE(CAST(ROUND((julianday(timestamp) - 2440587.5) * 86400000.0) AS INTEGER) * 1000, 0),
+                       level, message
+                FROM logs
+                """
+            )
+            conn.execute("DROP TABLE logs")
+            conn.execute("ALTER TABLE logs_new RENAME TO logs")
+        conn.commit()
+    except sqlite3.Error:
+        conn.rollback()
+        raise
+    return migrated
+
+
+def _init_fts(conn: sqlite3.Connection, schema: TableSchema) -> None:
+    """Create a table's FTS5 index and triggers, backfilling it on first creation.
+
+    Skipped silently if this SQLite build lacks FTS5 (or the trigram
+    tokenizer); searches then fall back to LIKE.
+    """
+    fts_table = schema.get("fts_table")
+    try:
+        exists = fts_table is None or conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = ?", [fts_table]
+        ).fetchone() is not None
+        for sql in schema.get("fts", []):
+            conn.execute(sql)
+        if not exists:
+            # Index rows that predate the FTS table
+            conn.execute(f"INSERT INTO {fts_table}({fts_table}) VALUES ('rebuild')")
+    except sqlite3.OperationalError:
+        pass
+
+
 def init_all_sqlite_tables(project_path: Path | None = None) -> sqlite3.Connection:
     """Initialize all SQLite tables and return connection.
 
@@ -3,13 +3,26 @@
 from glee.connect import storage
 
 
-def _resolve_github_credential() -> storage.ServiceCredential | None:
+def _github_credentials() -> list[storage.ServiceCredential]:
+    """All GitHub service credentials, collected in a single pass."""
+    return [
+        c for c in storage.ConnectionStorage.all()
+        if c.vendor == "github" and isinstance(c, storage.ServiceCredential)
+    ]
+
+
+def _resolve_github_credential(
+    github_creds: list[storage.ServiceCredential] | None = None,
+) -> storage.ServiceCredential | None:
     """Resolve which GitHub credential to use.
 
     Resolution order:
     1. Project config: credentials.github in .glee/config.yml
     2. Auto-detect: If only one GitHub service credential exists, use it
 
+    Args:
+        github_creds: Pre-collected GitHub credentials, to avoid re-reading.
+
     Returns:
         ServiceCredential or None if not found/ambiguous.
     """
@@ -26,10 +39,8 @@ def _resolve_github_credential() -> storage.ServiceCredential | None:
                 return cred
 
     # 2. Auto-detect: find all GitHub service credentials
-    github_creds = [
-        c for c in storage.ConnectionStorage.all()
-        if c.vendor == "github" and isinstance(c, storage.ServiceCredential)
-    ]
+    if github_creds is None:
+        github_creds = _github_credentials()
 
     if len(github_creds) == 1:
         return github_creds[0]
@@ -60,18 +71,12 @@ def require_token() -> str:
     Raises:
         ValueError: If no GitHub credential found or multiple exist without config.
     """
-    from glee.config import get_project_config
-
-    cred = _resolve_github_credential()
+    github_creds = _github_credentials()
+    cred = _resolve_github_credential(github_creds)
     if cred:
         return cred.key
 
     # Provide helpful error message
-    github_creds = [
-        c for c in storage.ConnectionStorage.all()
-        if c.vendor == "github" and isinstance(c, storage.ServiceCredential)
-    ]
-
     if len(github_creds) == 0:
         raise ValueError("No GitHub credentials. Run: glee connect github")
 
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass
 from typing import Any
 
@@ -9,6 +10,9 @@ import httpx
 
 from glee.github.auth import require_token
 
+# One entry of a Link header: <...?page=N...>; rel="next"
+_LINK_PAGE_RE = re.compile(r'<[^>]*[?&]page=(\d+)[^>]*>;\s*rel="(\w+)"')
+
 
 @dataclass
 class Issue:
@@ -157,16 +161,16 @@ class GitHubClient:
             if not data:
                 break
 
-            for f in data:
-                files.append(
-                    PRFile(
-                        filename=f["filename"],
-                        status=f["status"],
-                        additions=f["additions"],
-                        deletions=f["deletions"],
-                        patch=f.get("patch"),
-                    )
+            files.extend([
+                PRFile(
+                    filename=f["filename"],
+                    status=f["status"],
+                    additions=f["additions"],
+                    deletions=f["deletions"],
+                    patch=f.get("patch"),
                 )
+                for f in data
+            ])
 
             if len(data) < 100:
                 break
@@ -603,10 +607,8 @@ class GitHubClient:
         if not link_header:
             return pagination
 
-        import re
-
         for part in link_header.split(","):
-            match = re.search(r'<[^>]*[?&]page=(\d+)[^>]*>;\s*rel="(\w+)"', part)
+            match = _LINK_PAGE_RE.search(part)
             if match:
                 page_num = int(match.group(1))
                 rel = match.group(2)
@@ -10,8 +10,15 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+import orjson
+
 logger = logging.getLogger(__name__)
 
+_CAPTURE_BLOCK_RE = re.compile(
+    r"<glee_memory_capture>(.*?)</glee_memory_capture>",
+    re.IGNORECASE | re.DOTALL,
+)
+
 
 def parse_time(value: str | datetime | None) -> datetime | None:
     """Parse a timestamp value (string or datetime)."""
@@ -33,12 +40,23 @@ def parse_metadata(value: Any) -> dict[str, Any]:
         return dict(value)
     if isinstance(value, str) and value.strip():
         try:
-            return json.loads(value)
-        except json.JSONDecodeError:
+            return orjson.loads(value)
+        except orjson.JSONDecodeError:
             return {}
     return {}
 
 
+def parse_focus(value: str | None) -> list[str] | None:
+    """Parse a comma-separated focus list, dropping blanks and duplicates.
+
+    Order is preserved (dict.fromkeys) so prompts stay stable.
+    """
+    if not value:
+        return None
+    focus = list(dict.fromkeys(f for f in (part.strip() for part in value.split(",")) if f))
+    return focus or None
+
+
 def git_head(path: Path) -> str | None:
     """Get the current HEAD commit SHA."""
     result = subprocess.run(
@@ -69,18 +87,64 @@ def git_diff_since(path: Path, base: str, limit: int = 20) -> tuple[list[str], b
 
 
 def git_status_changes(path: Path, limit: int = 20) -> tuple[list[str], bool]:
-    """Get uncommitted file changes."""
+    """Get uncommitted file changes as porcelain v1 "XY path" lines."""
+    _, changes, available = git_status_snapshot(path, limit)
+    return changes, available
+
+
+def git_status_snapshot(path: Path, limit: int = 20) -> tuple[str | None, list[str], bool]:
+    """Get HEAD and uncommitted changes from a single `git status` run.
+
+    Uses porcelain v2 with --branch, whose header carries the HEAD commit, so
+    callers that need both skip a separate `git rev-parse HEAD`. Output is
+    NUL-delimited (-z) and read as bytes: paths with spaces, quotes or
+    newlines come through verbatim rather than C-quoted or split, and entries
+    are only decoded until `limit` are collected.
+
+    Returns:
+        (head_sha, changes, available). head_sha is None before the first
+        commit; changes are porcelain v1 style "XY path" lines; available is
+        False if git failed (e.g. not a repository).
+    """
     result = subprocess.run(
-        ["git", "status", "--porcelain=v1"],
+        ["git", "status", "--porcelain=v2", "--branch", "--no-ahead-behind", "-z"],
         cwd=path,
         capture_output=True,
-        text=True,
         check=False,
     )
     if result.returncode != 0:
-        return [], False
-    lines = [line for line in result.stdout.splitlines() if line.strip()]
-    return lines[:limit], True
+        return None, [], False
+    head: str | None = None
+    changes: list[str] = []
+    entries = iter(result.stdout.split(b"\0"))
+    for entry in entries:
+        if entry.startswith(b"# branch.oid "):
+            oid = entry[13:].decode("ascii", "replace")
+            head = None if oid == "(initial)" else oid
+            continue
+        if len(changes) >= limit or not entry or entry.startswith(b"#"):
+            continue
+        kind = entry[:1]
+        if kind == b"1":
+            # 1 XY sub mH mI mW hH hI path
+            fields = entry.split(b" ", 8)
+            line = f"{fields[1].decode()} {fields[8].decode('utf-8', 'replace')}"
+        elif kind == b"2":
+            # 2 XY sub mH mI mW hH hI Xscore path, then the source path entry
+            fields = entry.split(b" ", 9)
+            source = next(entries, b"").decode("utf-8", "replace")
+            line = f"{fields[1].decode()} {source} -> {fields[9].decode('utf-8', 'replace')}"
+        elif kind == b"u":
+            # u XY sub m1 m2 m3 mW h1 h2 h3 path
+            fields = entry.split(b" ", 10)
+            line = f"{fields[1].decode()} {fields[10].decode('utf-8', 'replace')}"
+        elif kind in (b"?", b"!"):
+            line = f"{(kind * 2).decode()} {entry[2:].decode('utf-8', 'replace')}"
+        else:
+            continue
+        # v2 marks an unchanged side with "." where v1 uses a space
+        changes.append(line[:2].replace(".", " ") + line[2:])
+    return head, changes, True
 
 
 def strip_code_fence(text: str) -> str:
@@ -99,6 +163,38 @@ def strip_code_fence(text: str) -> str:
     return "\n".join(lines).strip()
 
 
+def extract_json_object(text: str) -> str | None:
+    """Return the first balanced {...} object in text, or None.
+
+    Single forward scan tracking brace depth and string state (so braces
+    inside JSON strings are ignored); no regex backtracking.
+    """
+    start = text.find("{")
+    if start < 0:
+        return None
+    depth = 0
+    in_string = False
+    escaped = False
+    for i in range(start, len(text)):
+        ch = text[i]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif ch == "\\":
+                escaped = True
+            elif ch == '"':
+                in_string = False
+        elif ch == '"':
+            in_string = True
+        elif ch == "{":
+            depth += 1
+        elif ch == "}":
+            depth -= 1
+            if depth == 0:
+                return text[start : i + 1]
+    return None
+
+
 def extract_capture_block(text: str | None) -> tuple[dict[str, Any] | None, str | None]:
     """Extract glee_memory_capture block from text.
 
@@ -106,11 +202,7 @@ def extract_capture_block(text: str | None) -> tuple[dict[str, Any] | None, str
     """
     if not text:
         return None, text
-    match = re.search(
-        r"<glee_memory_capture>(.*?)</glee_memory_capture>",
-        text,
-        flags=re.IGNORECASE | re.DOTALL,
-    )
+    match = _CAPTURE_BLOCK_RE.search(text)
     if not match:
         return None, text
     raw = strip_code_fence(match.group(1))
@@ -1,10 +1,14 @@
 """Logging configuration for Glee with SQLite storage."""
 
-
+import atexit
+import functools
+import queue
 import re
 import sqlite3
 import sys
-from datetime import datetime
+import threading
+import traceback
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 from uuid import uuid4
@@ -16,31 +20,54 @@ from glee.db.sqlite import get_sqlite_connection, init_sqlite
 if TYPE_CHECKING:
     from loguru import Logger
 
-# Patterns for sensitive content redaction
-_SENSITIVE_PATTERNS = [
+# Patterns for sensitive content redaction (compiled on first use)
+_SENSITIVE_PATTERN_SOURCES: list[tuple[str, str]] = [
     # API keys (various formats)
-    (re.compile(r"(sk-[a-zA-Z0-9]{20,})", re.IGNORECASE), r"[REDACTED_API_KEY]"),
-    (re.compile(r"(api[_-]?key\s*[=:]\s*)['\"]?([a-zA-Z0-9_-]{20,})['\"]?", re.IGNORECASE), r"\1[REDACTED]"),
-    (re.compile(r"(secret[_-]?key\s*[=:]\s*)['\"]?([a-zA-Z0-9_-]{20,})['\"]?", re.IGNORECASE), r"\1[REDACTED]"),
+    (r"(sk-[a-zA-Z0-9]{20,})", r"[REDACTED_API_KEY]"),
+    (r"(api[_-]?key\s*[=:]\s*)['\"]?([a-zA-Z0-9_-]{20,})['\"]?", r"\1[REDACTED]"),
+    (r"(secret[_-]?key\s*[=:]\s*)['\"]?([a-zA-Z0-9_-]{20,})['\"]?", r"\1[REDACTED]"),
     # Bearer tokens
-    (re.compile(r"(Bearer\s+)([a-zA-Z0-9._-]{20,})", re.IGNORECASE), r"\1[REDACTED_TOKEN]"),
+    (r"(Bearer\s+)([a-zA-Z0-9._-]{20,})", r"\1[REDACTED_TOKEN]"),
     # Passwords in URLs or config
-    (re.compile(r"(password\s*[=:]\s*)['\"]?([^\s'\"]+)['\"]?", re.IGNORECASE), r"\1[REDACTED]"),
-    (re.compile(r"(passwd\s*[=:]\s*)['\"]?([^\s'\"]+)['\"]?", re.IGNORECASE), r"\1[REDACTED]"),
-    (re.compile(r"(pwd\s*[=:]\s*)['\"]?([^\s'\"]+)['\"]?", re.IGNORECASE), r"\1[REDACTED]"),
+    (r"(password\s*[=:]\s*)['\"]?([^\s'\"]+)['\"]?", r"\1[REDACTED]"),
+    (r"(passwd\s*[=:]\s*)['\"]?([^\s'\"]+)['\"]?", r"\1[REDACTED]"),
+    (r"(pwd\s*[=:]\s*)['\"]?([^\s'\"]+)['\"]?", r"\1[REDACTED]"),
     # Connection strings with passwords
-    (re.compile(r"(:\/\/[^:]+:)([^@]+)(@)", re.IGNORECASE), r"\1[REDACTED]\3"),
+    (r"(:\/\/[^:]+:)([^@]+)(@)", r"\1[REDACTED]\3"),
     # AWS credentials
-    (re.compile(r"(AKIA[0-9A-Z]{16})", re.IGNORECASE), r"[REDACTED_AWS_KEY]"),
-    (re.compile(r"(aws_secret_access_key\s*[=:]\s*)['\"]?([a-zA-Z0-9/+=]{40})['\"]?", re.IGNORECASE), r"\1[REDACTED]"),
+    (r"(AKIA[0-9A-Z]{16})", r"[REDACTED_AWS_KEY]"),
+    (r"(aws_secret_access_key\s*[=:]\s*)['\"]?([a-zA-Z0-9/+=]{40})['\"]?", r"\1[REDACTED]"),
     # GitHub tokens
-    (re.compile(r"(ghp_[a-zA-Z0-9]{36})", re.IGNORECASE), r"[REDACTED_GH_TOKEN]"),
-    (re.compile(r"(gho_[a-zA-Z0-9]{36})", re.IGNORECASE), r"[REDACTED_GH_TOKEN]"),
+    (r"(ghp_[a-zA-Z0-9]{36})", r"[REDACTED_GH_TOKEN]"),
+    (r"(gho_[a-zA-Z0-9]{36})", r"[REDACTED_GH_TOKEN]"),
     # Generic secrets
-    (re.compile(r"(token\s*[=:]\s*)['\"]?([a-zA-Z0-9_-]{20,})['\"]?", re.IGNORECASE), r"\1[REDACTED]"),
-    (re.compile(r"(secret\s*[=:]\s*)['\"]?([a-zA-Z0-9_-]{16,})['\"]?", re.IGNORECASE), r"\1[REDACTED]"),
+    (r"(token\s*[=:]\s*)['\"]?([a-zA-Z0-9_-]{20,})['\"]?", r"\1[REDACTED]"),
+    (r"(secret\s*[=:]\s*)['\"]?([a-zA-Z0-9_-]{16,})['\"]?", r"\1[REDACTED]"),
 ]
 
+
+@functools.cache
+def _sensitive_patterns() -> list[tuple[re.Pattern[str], str]]:
+    """Compile the redaction patterns once, on first redaction."""
+    return [(re.compile(p, re.IGNORECASE), r) for p, r in _SENSITIVE_PATTERN_SOURCES]
+
+
+# Insert statements, kept as constants so the connection's statement cache
+# always sees the identical SQL string
+_INSERT_LOG_SQL = "INSERT INTO logs (timestamp, level, message) VALUES (?, ?, ?)"
+_INSERT_AGENT_LOG_SQL = (
+    "INSERT INTO agent_logs"
+    " (id, timestamp, agent, prompt, output, raw, error, exit_code, duration_ms, success)"
+    " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+)
+
+# logs.timestamp holds integer microseconds since the Unix epoch
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+
+# Shortest search term the trigram FTS index can match
+_FTS_MIN_SEARCH_LEN = 3
+
 # Default logging settings
 DEFAULT_LOG_SETTINGS = {
     "enabled": True,
@@ -86,7 +113,7 @@ def redact_sensitive(text: str | None) -> str | None:
         return None
 
     result = text
-    for pattern, replacement in _SENSITIVE_PATTERNS:
+    for pattern, replacement in _sensitive_patterns():
         result = pattern.sub(replacement, result)
 
     return result
@@ -186,11 +213,7 @@ class AgentRunLogger:
 
         log_id = str(uuid4())[:8]
         self.conn.execute(
-            """
-            INSERT INTO agent_logs
-            (id, timestamp, agent, prompt, output, raw, error, exit_code, duration_ms, success)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
+            _INSERT_AGENT_LOG_SQL,
             [
                 log_id,
                 datetime.now().isoformat(),
@@ -258,7 +281,6 @@ def query_agent_logs(
         List of agent log records.
     """
     conn = get_sqlite_connection(project_path)
-    conn.row_factory = sqlite3.Row
 
     query = "SELECT * FROM agent_logs WHERE 1=1"
     params: list[Any] = []
@@ -274,13 +296,12 @@ def query_agent_logs(
     params.append(limit)
 
     try:
-        cursor = conn.execute(query, params)
-        results = [dict(row) for row in cursor.fetchall()]
+        cursor = conn.cursor()
+        cursor.row_factory = sqlite3.Row
+        results = [dict(row) for row in cursor.execute(query, params).fetchall()]
     except sqlite3.OperationalError:
         # Table doesn't exist yet
         results = []
-    finally:
-        conn.close()
 
     return results
 
@@ -296,15 +317,13 @@ def get_agent_log(project_path: Path, log_id: str) -> dict[str, Any] | None:
         Log record or None if not found.
     """
     conn = get_sqlite_connection(project_path)
-    conn.row_factory = sqlite3.Row
 
     try:
-        cursor = conn.execute("SELECT * FROM agent_logs WHERE id = ?", [log_id])
-        row = cursor.fetchone()
+        cursor = conn.cursor()
+        cursor.row_factory = sqlite3.Row
+        row = cursor.execute("SELECT * FROM agent_logs WHERE id = ?", [log_id]).fetchone()
     except sqlite3.OperationalError:
         row = None
-    finally:
-        conn.close()
 
     return dict(row) if row else None
 
@@ -312,15 +331,27 @@ def get_agent_log(project_path: Path, log_id: str) -> dict[str, Any] | None:
 class SQLiteLogHandler:
     """Custom log handler that stores logs in SQLite.
 
+    write() only enqueues the record; a background thread drains the queue
+    and inserts records in batches, one transaction per batch.
+
     Supports log rotation via logging.max_general_logs config setting.
     """
 
+    _BATCH_SIZE = 500  # Max records per transaction
+    _FLUSH_INTERVAL = 0.05  # Seconds to wait for more records before committing
+
     def __init__(self, project_path: Path):
         self.project_path = project_path
         self._settings = _get_log_settings(project_path)
         self._write_count = 0  # Track writes to avoid checking rotation on every write
         self._init_db()
 
+        # Items are record tuples, threading.Event flush markers, or None to stop
+        self._queue: queue.SimpleQueue[tuple[int, str, str] | threading.Event | None] = queue.SimpleQueue()
+        self._thread = threading.Thread(target=self._run_writer, name="glee-log-writer", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
     @property
     def conn(self) -> sqlite3.Connection:
         """Get thread-local SQLite connection."""
@@ -356,34 +387,140 @@ class SQLiteLogHandler:
             pass
 
     def write(self, message: Any) -> None:
-        """Write a log record to SQLite."""
+        """Queue a log record for the background writer.
+
+        Once the writer has stopped (closed, or died), the record is inserted
+        synchronously on the calling thread instead.
+        """
         record = message.record
+        item = (_to_epoch_us(record["time"]), record["level"].name, record["message"])
+        if self._thread.is_alive():
+            self._queue.put(item)
+        else:
+            self._write_sync([item])
+
+    def _run_writer(self) -> None:
+        """Drain the queue, inserting records in batches until stopped."""
+        get = self._queue.get
+        conn = self.conn
+        cursor = conn.cursor()  # Reused for every batch on this thread
+        running = True
+        while running:
+            batch: list[tuple[int, str, str]] = []
+            waiters: list[threading.Event] = []
+
+            item = get()
+            while True:
+                if item is None:
+                    running = False
+                    break
+                if isinstance(item, threading.Event):
+                    waiters.append(item)
+                    break
+                batch.append(item)
+                if len(batch) >= self._BATCH_SIZE:
+                    break
+                try:
+                    item = get(timeout=self._FLUSH_INTERVAL)
+                except queue.Empty:
+                    break
+
+            try:
+                if batch:
+                    self._insert_batch(conn, cursor, batch)
+            except Exception:
+                # Drop this batch but keep the writer alive for the next one
+                _report_write_error(len(batch))
+            finally:
+                for waiter in waiters:
+                    waiter.set()
 
-        self.conn.execute(
-            """
-            INSERT INTO logs (timestamp, level, message)
-            VALUES (?, ?, ?)
-            """,
-            [
-                record["time"].isoformat(),
-                record["level"].name,
-                record["message"],
-            ],
-        )
-        self.conn.commit()
+        close_thread_connections()
+
+    def _insert_batch(
+        self,
+        conn: sqlite3.Connection,
+        cursor: sqlite3.Cursor,
+        batch: list[tuple[int, str, str]],
+    ) -> None:
+        """Insert a batch of records in a single transaction.
+
+        Raises sqlite3.Error (after rolling back) so callers can report the
+        lost records.
+        """
+        with conn:
+            cursor.executemany(_INSERT_LOG_SQL, batch)
 
         # Check rotation every 100 writes to avoid overhead
-        self._write_count += 1
+        self._write_count += len(batch)
         if self._write_count >= 100:
             self._rotate_logs()
             self._write_count = 0
 
+    def _write_sync(self, batch: list[tuple[int, str, str]]) -> None:
+        """Insert records on the calling thread (used once the writer is gone)."""
+        try:
+            conn = self.conn
+            self._insert_batch(conn, conn.cursor(), batch)
+        except Exception:
+            _report_write_error(len(batch))
+
+    def _drain(self) -> None:
+        """Write anything left in the queue synchronously and release waiters."""
+        batch: list[tuple[int, str, str]] = []
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if isinstance(item, threading.Event):
+                item.set()
+            elif item is not None:
+                batch.append(item)
+        if batch:
+            self._write_sync(batch)
+
+    def flush(self, timeout: float = 5.0) -> None:
+        """Block until records queued so far are committed."""
+        if self._thread.is_alive():
+            done = threading.Event()
+            self._queue.put(done)
+            done.wait(timeout)
+        if not self._thread.is_alive():
+            # Writer died (or was stopped) with records still queued
+            self._drain()
+
     def close(self) -> None:
-        """Close thread-local database connections."""
-        from glee.db.sqlite import close_thread_connections
+        """Flush pending records, stop the writer and close connections."""
+        atexit.unregister(self.close)
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join(timeout=5)
+        if not self._thread.is_alive():
+            self._drain()
         close_thread_connections()
 
 
+def _report_write_error(count: int) -> None:
+    """Report records the handler could not store (logging them could recurse)."""
+    print(f"glee: failed to write {count} log record(s) to SQLite", file=sys.stderr)
+    traceback.print_exc(file=sys.stderr)
+
+
+def _to_epoch_us(dt: datetime) -> int:
+    """Convert a datetime (naive means local time) to epoch microseconds."""
+    if dt.tzinfo is None:
+        dt = dt.astimezone()
+    return (dt - _EPOCH) // _MICROSECOND
+
+
+def _from_epoch_us(value: int | str) -> str:
+    """Format a logs.timestamp value as a local ISO-8601 string."""
+    if isinstance(value, str):  # Row not yet migrated
+        return value
+    return (_EPOCH + value * _MICROSECOND).astimezone().isoformat()
+
+
 _log_handler: SQLiteLogHandler | None = None
 
 
@@ -407,6 +544,11 @@ def setup_logging(project_path: Path | None = None) -> "Logger":
         level="DEBUG",
     )
 
+    # Stop the previous handler's writer (flushes anything still queued)
+    if _log_handler is not None:
+        _log_handler.close()
+        _log_handler = None
+
     # SQLite logging if project path provided
     if project_path:
         _log_handler = SQLiteLogHandler(project_path)
@@ -415,6 +557,12 @@ def setup_logging(project_path: Path | None = None) -> "Logger":
     return logger
 
 
+def _flush_pending_logs() -> None:
+    """Commit queued log records so queries in this process see them."""
+    if _log_handler is not None:
+        _log_handler.flush()
+
+
 def query_logs(
     project_path: Path,
     level: str | None = None,
@@ -422,6 +570,7 @@ def query_logs(
     until: datetime | None = None,
     search: str | None = None,
     limit: int = 100,
+    prefix: str | None = None,
 ) -> list[dict[str, Any]]:
     """Query logs from SQLite.
 
@@ -432,13 +581,40 @@ def query_logs(
         until: Filter logs before this time.
         search: Search in message text.
         limit: Max number of results.
+        prefix: Only messages starting with this text (case-insensitive).
 
     Returns:
-        List of log records.
+        List of log records (timestamps as local ISO-8601 strings).
     """
+    _flush_pending_logs()
     conn = get_sqlite_connection(project_path)
-    conn.row_factory = sqlite3.Row
 
+    # Substring search goes through the trigram FTS index when the term is long
+    # enough to produce a trigram; LIKE covers short terms and databases
+    # without logs_fts
+    use_fts = bool(search) and len(search) >= _FTS_MIN_SEARCH_LEN
+    try:
+        return _run_logs_query(conn, level, since, until, search, prefix, limit, use_fts)
+    except sqlite3.OperationalError:
+        if not use_fts:
+            return []
+    try:
+        return _run_logs_query(conn, level, since, until, search, prefix, limit, False)
+    except sqlite3.OperationalError:
+        return []
+
+
+def _run_logs_query(
+    conn: sqlite3.Connection,
+    level: str | None,
+    since: datetime | None,
+    until: datetime | None,
+    search: str | None,
+    prefix: str | None,
+    limit: int,
+    use_fts: bool,
+) -> list[dict[str, Any]]:
+    """Build and run the query_logs SELECT."""
     query = "SELECT * FROM logs WHERE 1=1"
     params: list[Any] = []
 
@@ -448,30 +624,42 @@ def query_logs(
 
     if since:
         query += " AND timestamp >= ?"
-        params.append(since.isoformat())
+        params.append(_to_epoch_us(since))
 
     if until:
         query += " AND timestamp <= ?"
-        params.append(until.isoformat())
+        params.append(_to_epoch_us(until))
 
     if search:
-        query += " AND message LIKE ?"
-        params.append(f"%{search}%")
+        if use_fts:
+            # Quoted FTS5 phrase: matches the literal substring
+            query += " AND id IN (SELECT rowid FROM logs_fts WHERE logs_fts MATCH ?)"
+            params.append('"' + search.replace('"', '""') + '"')
+        else:
+            query += " AND message LIKE ? ESCAPE '\\'"
+            params.append(f"%{_escape_like(search)}%")
+
+    if prefix:
+        query += " AND message LIKE ? ESCAPE '\\'"
+        params.append(_escape_like(prefix) + "%")
 
     query += " ORDER BY timestamp DESC LIMIT ?"
     params.append(limit)
 
-    try:
-        cursor = conn.execute(query, params)
-        results = [dict(row) for row in cursor.fetchall()]
-    except sqlite3.OperationalError:
-        results = []
-    finally:
-        conn.close()
-
+    cursor = conn.cursor()
+    cursor.row_factory = sqlite3.Row
+    results = [dict(row) for row in cursor.execute(query, params).fetchall()]
+    # Timestamps are only formatted at the API boundary
+    for result in results:
+        result["timestamp"] = _from_epoch_us(result["timestamp"])
     return results
 
 
+def _escape_like(text: str) -> str:
+    """Escape LIKE wildcards (with backslash as the ESCAPE character)."""
+    return text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
 def get_log_stats(project_path: Path) -> dict[str, Any]:
     """Get log statistics.
 
@@ -481,21 +669,17 @@ def get_log_stats(project_path: Path) -> dict[str, Any]:
     Returns:
         Dictionary with log stats.
     """
+    _flush_pending_logs()
     conn = get_sqlite_connection(project_path)
 
     try:
-        # Total count
-        total = conn.execute("SELECT COUNT(*) FROM logs").fetchone()[0]
-
-        # Count by level
+        # Count by level; the total is their sum (one scan instead of two)
         cursor = conn.execute(
             "SELECT level, COUNT(*) as count FROM logs GROUP BY level"
         )
         by_level = {row[0]: row[1] for row in cursor.fetchall()}
     except sqlite3.OperationalError:
-        total = 0
         by_level = {}
-    finally:
-        conn.close()
+    total = sum(by_level.values())
 
     return {"total": total, "by_level": by_level}
@@ -2,16 +2,27 @@
 
 from __future__ import annotations
 
+import asyncio
+import functools
+import io
 import logging
+import os
+import re
+import time
+import traceback
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, cast
+from typing import Any, cast
 
 from mcp.server import Server
 
-from glee.helpers import extract_capture_block, git_head, git_status_changes
-
-if TYPE_CHECKING:
-    from glee.agent_session import Session
+import glee.agent_session as session_mod
+from glee.agent_session import Session
+from glee.agents import registry
+from glee.config import SUPPORTED_REVIEWERS, clear_reviewer, get_project_config, set_reviewer
+from glee.github import GitHubClient
+from glee.helpers import extract_capture_block, git_status_snapshot, parse_focus, parse_time
+from glee.logging import get_agent_logger
+from glee.subagent import SubagentLoadError, load_subagent, render_prompt
 
 logger = logging.getLogger(__name__)
 
@@ -32,11 +43,24 @@ _LOG_LEVEL_ORDER = {
     "emergency": 70,
 }
 
+# Fixed error responses shared across handlers; built once since TextContent
+# construction goes through pydantic validation. Handlers return them in a
+# fresh list (`[_ERR_X]`) so callers never share a mutable result.
+_ERR_NOT_INITIALIZED = TextContent(type="text", text="Project not initialized. Run 'glee init' first.")
+_ERR_OWNER_REPO = TextContent(type="text", text="Error: owner and repo are required")
+_ERR_OWNER_REPO_NUMBER = TextContent(type="text", text="Error: owner, repo, and number are required")
+_ERR_QUERY = TextContent(type="text", text="Error: query is required")
 
 
 @server.list_tools()
 async def list_tools() -> list[Tool]:
     """List available Glee tools."""
+    return list(_tool_definitions())
+
+
+@functools.cache
+def _tool_definitions() -> list[Tool]:
+    """Build the tool definitions once; they're static and pydantic-validated."""
     return [
         Tool(
             name="glee.status",
@@ -568,43 +592,42 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
 
 async def _handle_status() -> list[TextContent]:
     """Handle glee_status tool call."""
-    from glee.agents import registry
-    from glee.config import get_project_config, get_reviewers
-
-    lines: list[str] = []
+    buf = io.StringIO()
 
     # Global status
-    lines.append("Glee Status")
-    lines.append("=" * 40)
-    lines.append("")
-    lines.append("CLI Availability:")
+    buf.write("Glee Status\n")
+    buf.write("=" * 40 + "\n")
+    buf.write("\n")
+    buf.write("CLI Availability:\n")
     for cli_name in ["codex", "claude", "gemini"]:
         agent = registry.get(cli_name)
         status = "found" if agent and agent.is_available() else "not found"
-        lines.append(f"  {cli_name}: {status}")
+        buf.write(f"  {cli_name}: {status}\n")
 
-    lines.append("")
+    buf.write("\n")
 
     # Project status
     config = get_project_config()
     if not config:
-        lines.append("Current directory: not configured")
-        lines.append("Run 'glee init' to initialize.")
+        buf.write("Current directory: not configured\n")
+        buf.write("Run 'glee init' to initialize.\n")
     else:
         project = config.get("project", {})
-        lines.append(f"Project: {project.get('name')}")
-        lines.append("")
-
-        # Reviewers
-        reviewers = get_reviewers()
-        lines.append("Reviewers:")
-        lines.append(f"  Primary: {reviewers.get('primary', 'codex')}")
-        if reviewers.get("secondary"):
-            lines.append(f"  Secondary: {reviewers.get('secondary')}")
+        buf.write(f"Project: {project.get('name')}\n")
+        buf.write("\n")
+
+        # Reviewers (from the config already loaded)
+        reviewers: dict[str, str] = config.get("reviewers", {"primary": "codex"})
+        secondary = reviewers.get("secondary")
+        buf.write("Reviewers:\n")
+        buf.write(f"  Primary: {reviewers.get('primary', 'codex')}\n")
+        if secondary:
+            buf.write(f"  Secondary: {secondary}\n")
         else:
-            lines.append("  Secondary: (not set)")
+            buf.write("  Secondary: (not set)\n")
 
-    return [TextContent(type="text", text="\n".join(lines))]
+    # Lines are newline-terminated; the response has no trailing newline
+    return [TextContent(type="text", text=buf.getvalue().removesuffix("\n"))]
 
 
 async def _handle_review(arguments: dict[str, Any]) -> list[TextContent]:
@@ -612,15 +635,6 @@ async def _handle_review(arguments: dict[str, Any]) -> list[TextContent]:
 
     Uses the configured primary reviewer to analyze code.
     """
-    import asyncio
-    import concurrent.futures
-    from pathlib import Path
-
-    from glee.agents import registry
-    from glee.config import get_project_config
-    from glee.dispatch import get_primary_reviewer
-    from glee.logging import get_agent_logger
-
     # Get session for sending log notifications to Claude Code
     try:
         ctx = server.request_context
@@ -630,10 +644,11 @@ async def _handle_review(arguments: dict[str, Any]) -> list[TextContent]:
 
     # Get log level threshold from arguments (default: debug for full observability)
     log_level_threshold = arguments.get("log_level", "debug")
+    min_level = _LOG_LEVEL_ORDER.get(log_level_threshold, 0)
 
     def should_log(level: str) -> bool:
         """Check if message level meets the threshold."""
-        return _LOG_LEVEL_ORDER.get(level, 0) >= _LOG_LEVEL_ORDER.get(log_level_threshold, 0)
+        return _LOG_LEVEL_ORDER.get(level, 0) >= min_level
 
     async def send_log(message: str, level: str = "info") -> None:
         """Send a log message to Claude Code via MCP notification."""
@@ -645,7 +660,7 @@ async def _handle_review(arguments: dict[str, Any]) -> list[TextContent]:
 
     config = get_project_config()
     if not config:
-        return [TextContent(type="text", text="Project not initialized. Run 'glee init' first.")]
+        return [_ERR_NOT_INITIALIZED]
 
     # Get project path for logging
     project_path = Path(config.get("project", {}).get("path", "."))
@@ -653,8 +668,8 @@ async def _handle_review(arguments: dict[str, Any]) -> list[TextContent]:
     # Initialize agent logger for this project
     get_agent_logger(project_path)
 
-    # Get primary reviewer
-    reviewer_cli = get_primary_reviewer()
+    # Get primary reviewer (from the config already loaded)
+    reviewer_cli: str = config.get("reviewers", {"primary": "codex"}).get("primary", "codex")
     agent = registry.get(reviewer_cli)
     if not agent:
         return [TextContent(type="text", text=f"Reviewer CLI '{reviewer_cli}' not found in registry.")]
@@ -666,7 +681,7 @@ async def _handle_review(arguments: dict[str, Any]) -> list[TextContent]:
 
     # Parse focus
     focus_str: str = arguments.get("focus", "")
-    focus_list: list[str] | None = [f.strip() for f in focus_str.split(",")] if focus_str else None
+    focus_list = parse_focus(focus_str)
 
     # Print header
     header = f"\n{'='*60}\nGLEE REVIEW: {target}\nReviewer: {reviewer_cli}\n{'='*60}\n\n"
@@ -674,7 +689,10 @@ async def _handle_review(arguments: dict[str, Any]) -> list[TextContent]:
     # Send log notification to Claude Code
     await send_log(header)
 
-    lines: list[str] = [f"Reviewed by {reviewer_cli}", f"Target: {target}", ""]
+    # Response is written incrementally rather than joined from a list, so a
+    # long review isn't held twice
+    buf = io.StringIO()
+    buf.write(f"Reviewed by {reviewer_cli}\nTarget: {target}\n\n")
 
     # Get running event loop for thread-safe async calls
     loop = asyncio.get_running_loop()
@@ -706,37 +724,33 @@ async def _handle_review(arguments: dict[str, Any]) -> list[TextContent]:
                 return result.output, f"{result.error} (exit_code={result.exit_code})"
             return result.output, None
         except Exception as e:
-            import traceback
             return None, f"{str(e)}\n{traceback.format_exc()}"
 
-    # Run review in thread to not block event loop
-    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-        output, error = await loop.run_in_executor(executor, run_review)
+    # Run review in the default executor to not block event loop
+    output, error = await asyncio.to_thread(run_review)
 
     # Footer
     footer = f"\n{'='*60}\nREVIEW COMPLETE\n{'='*60}\n\n"
     await send_log(footer)
 
     # Build MCP response
-    lines.append(f"=== {reviewer_cli.upper()} ===")
+    buf.write(f"=== {reviewer_cli.upper()} ===\n")
     if error:
-        lines.append(f"Error: {error}")
+        buf.write(f"Error: {error}\n")
     if output:
-        lines.append(output)
+        buf.write(output)
+        buf.write("\n")
     if not error and not output:
-        lines.append("(no output)")
-    lines.append("")
+        buf.write("(no output)\n")
 
-    return [TextContent(type="text", text="\n".join(lines))]
+    return [TextContent(type="text", text=buf.getvalue())]
 
 
 async def _handle_config_set(arguments: dict[str, Any]) -> list[TextContent]:
     """Handle glee_config_set tool call."""
-    from glee.config import SUPPORTED_REVIEWERS, get_project_config, set_reviewer
-
     config = get_project_config()
     if not config:
-        return [TextContent(type="text", text="Project not initialized. Run 'glee init' first.")]
+        return [_ERR_NOT_INITIALIZED]
 
     key: str | None = arguments.get("key")
     value: str | None = arguments.get("value")
@@ -765,11 +779,9 @@ async def _handle_config_set(arguments: dict[str, Any]) -> list[TextContent]:
 
 async def _handle_config_unset(arguments: dict[str, Any]) -> list[TextContent]:
     """Handle glee_config_unset tool call."""
-    from glee.config import clear_reviewer, get_project_config
-
     config = get_project_config()
     if not config:
-        return [TextContent(type="text", text="Project not initialized. Run 'glee init' first.")]
+        return [_ERR_NOT_INITIALIZED]
 
     key: str | None = arguments.get("key")
 
@@ -788,12 +800,11 @@ async def _handle_config_unset(arguments: dict[str, Any]) -> list[TextContent]:
 
 async def _handle_memory_add(arguments: dict[str, Any]) -> list[TextContent]:
     """Handle glee_memory_add tool call."""
-    from glee.config import get_project_config
     from glee.memory import Memory
 
     config = get_project_config()
     if not config:
-        return [TextContent(type="text", text="Project not initialized. Run 'glee init' first.")]
+        return [_ERR_NOT_INITIALIZED]
 
     category: str | None = arguments.get("category")
     content: str | None = arguments.get("content")
@@ -812,12 +823,11 @@ async def _handle_memory_add(arguments: dict[str, Any]) -> list[TextContent]:
 
 async def _handle_memory_list(arguments: dict[str, Any]) -> list[TextContent]:
     """Handle glee_memory_list tool call."""
-    from glee.config import get_project_config
     from glee.memory import Memory
 
     config = get_project_config()
     if not config:
-        return [TextContent(type="text", text="Project not initialized. Run 'glee init' first.")]
+        return [_ERR_NOT_INITIALIZED]
 
     category: str | None = arguments.get("category")
     limit_arg = arguments.get("limit", 50)
@@ -832,7 +842,7 @@ async def _handle_memory_list(arguments: dict[str, Any]) -> list[TextContent]:
     memory = Memory(project_path)
     try:
         if category:
-            results = memory.get_by_category(category)[:limit]
+            results = memory.get_by_category(category, limit=limit)
             if not results:
                 return [TextContent(type="text", text=f"No memories in category '{category}'")]
 
@@ -853,7 +863,7 @@ async def _handle_memory_list(arguments: dict[str, Any]) -> list[TextContent]:
 
         lines = ["All Memories:", ""]
         for cat in categories:
-            results = memory.get_by_category(cat)[:limit]
+            results = memory.get_by_category(cat, limit=limit)
             title = cat.replace("-", " ").replace("_", " ").title()
             lines.append(f"### {title} ({len(results)} entries)")
             for r in results:
@@ -866,12 +876,11 @@ async def _handle_memory_list(arguments: dict[str, Any]) -> list[TextContent]:
 
 async def _handle_memory_delete(arguments: dict[str, Any]) -> list[TextContent]:
     """Handle glee_memory_delete tool call."""
-    from glee.config import get_project_config
     from glee.memory import Memory
 
     config = get_project_config()
     if not config:
-        return [TextContent(type="text", text="Project not initialized. Run 'glee init' first.")]
+        return [_ERR_NOT_INITIALIZED]
 
     by: str | None = arguments.get("by")
     value: str | None = arguments.get("value")
@@ -902,12 +911,11 @@ async def _handle_memory_delete(arguments: dict[str, Any]) -> list[TextContent]:
 
 async def _handle_memory_search(arguments: dict[str, Any]) -> list[TextContent]:
     """Handle glee_memory_search tool call."""
-    from glee.config import get_project_config
     from glee.memory import Memory
 
     config = get_project_config()
     if not config:
-        return [TextContent(type="text", text="Project not initialized. Run 'glee init' first.")]
+        return [_ERR_NOT_INITIALIZED]
 
     query: str | None = arguments.get("query")
     if not query:
@@ -936,18 +944,94 @@ async def _handle_memory_search(arguments: dict[str, Any]) -> list[TextContent]:
         return [TextContent(type="text", text=f"Error searching memory: {e}")]
 
 
+# Documentation files gathered by glee_memory_overview(generate=True)
+_OVERVIEW_DOC_FILES = (
+    "README.md",
+    "CLAUDE.md",
+    "AGENTS.md",
+    "CONTRIBUTING.md",
+    "docs/README.md",
+    "docs/architecture.md",
+)
+
+# Package manifests gathered by glee_memory_overview(generate=True), with fence language
+_OVERVIEW_PACKAGE_FILES = (
+    ("pyproject.toml", "toml"),
+    ("package.json", "json"),
+    ("Cargo.toml", "toml"),
+    ("go.mod", "go"),
+)
+
+# Instructions appended to the generated overview context
+_OVERVIEW_INSTRUCTIONS = """
+Based on the documentation and structure above, analyze the project and create ONE comprehensive summary.
+
+Call glee.memory.add with:
+- category: "overview"
+- content: A comprehensive project summary covering:
+  - **Architecture**: Key patterns, module organization, data flow, entry points
+  - **Conventions**: Coding standards, naming patterns, file organization
+  - **Dependencies**: Key libraries and their purposes
+  - **Decisions**: Notable technical choices and trade-offs
+
+IMPORTANT:
+- Use category="overview" (not architecture, convention, etc.)
+- Write ONE comprehensive entry, not multiple scattered entries
+- This allows atomic refresh when the project evolves
+
+Example:
+glee.memory.add(category="overview", content=\"\"\"
+# Project Overview
+[Project name] is a [description].
+
+## Architecture
+- Entry point: src/main.py
+- CLI built with Typer
+- Data stored in SQLite + LanceDB
+
+## Conventions
+- snake_case for Python
+- Type hints required
+- Tests in tests/ directory
+
+## Key Dependencies
+- typer: CLI framework
+- lancedb: Vector storage
+
+## Technical Decisions
+- Using LanceDB for semantic search
+- MCP server for Claude Code integration
+\"\"\")
+"""
+
+
+def _read_head(path: Path, limit: int) -> str | None:
+    """Read at most `limit` characters of a text file, marking truncation.
+
+    Only the head of the file is read, so large docs are never loaded in full.
+
+    Returns:
+        The (possibly truncated) content, or None if the file can't be read.
+    """
+    try:
+        with open(path) as f:
+            content = f.read(limit + 1)
+    except Exception:
+        return None
+    if len(content) > limit:
+        content = content[:limit] + "\n\n... (truncated)"
+    return content
+
+
 async def _handle_memory_overview(arguments: dict[str, Any]) -> list[TextContent]:
     """Handle glee_memory_overview tool call - read or generate project overview."""
     from datetime import datetime, timezone
-    from pathlib import Path
 
-    from glee.config import get_project_config
-    from glee.helpers import parse_time
     from glee.memory import Memory
 
     config = get_project_config()
     if not config:
-        return [TextContent(type="text", text="Project not initialized. Run 'glee init' first.")]
+        return [_ERR_NOT_INITIALIZED]
 
     project_path = Path(config.get("project", {}).get("path", "."))
     generate = arguments.get("generate", False)
@@ -968,61 +1052,32 @@ async def _handle_memory_overview(arguments: dict[str, Any]) -> list[TextContent
             lines.append(f"Warning: Could not clear overview memories: {e}")
             lines.append("")
 
-        # Documentation files to look for
-        doc_files = [
-            "README.md",
-            "CLAUDE.md",
-            "AGENTS.md",
-            "CONTRIBUTING.md",
-            "docs/README.md",
-            "docs/architecture.md",
-        ]
-
         lines.append("# Project Documentation")
         lines.append("=" * 50)
         lines.append("")
 
-        for doc_file in doc_files:
-            doc_path = project_path / doc_file
-            if doc_path.exists():
-                try:
-                    content = doc_path.read_text()
-                    if len(content) > 5000:
-                        content = content[:5000] + "\n\n... (truncated)"
-                    lines.append(f"## {doc_file}")
-                    lines.append("```")
-                    lines.append(content)
-                    lines.append("```")
-                    lines.append("")
-                except Exception:
-                    pass
+        for doc_file in _OVERVIEW_DOC_FILES:
+            content = _read_head(project_path / doc_file, 5000)
+            if content is not None:
+                lines.append(f"## {doc_file}")
+                lines.append("```")
+                lines.append(content)
+                lines.append("```")
+                lines.append("")
 
         # Package configuration
         lines.append("# Package Configuration")
         lines.append("=" * 50)
         lines.append("")
 
-        package_files = [
-            ("pyproject.toml", "toml"),
-            ("package.json", "json"),
-            ("Cargo.toml", "toml"),
-            ("go.mod", "go"),
-        ]
-
-        for pkg_file, lang in package_files:
-            pkg_path = project_path / pkg_file
-            if pkg_path.exists():
-                try:
-                    content = pkg_path.read_text()
-                    if len(content) > 3000:
-                        content = content[:3000] + "\n\n... (truncated)"
-                    lines.append(f"## {pkg_file}")
-                    lines.append(f"```{lang}")
-                    lines.append(content)
-                    lines.append("```")
-                    lines.append("")
-                except Exception:
-                    pass
+        for pkg_file, lang in _OVERVIEW_PACKAGE_FILES:
+            content = _read_head(project_path / pkg_file, 3000)
+            if content is not None:
+                lines.append(f"## {pkg_file}")
+                lines.append(f"```{lang}")
+                lines.append(content)
+                lines.append("```")
+                lines.append("")
 
         # Directory structure (full tree)
         lines.append("# Directory Structure")
@@ -1032,20 +1087,24 @@ async def _handle_memory_overview(arguments: dict[str, Any]) -> list[TextContent
         def get_tree(path: Path, prefix: str = "", current_depth: int = 0) -> list[str]:
             tree_lines: list[str] = []
             try:
-                items = sorted(path.iterdir(), key=lambda x: (not x.is_dir(), x.name.lower()))
-                items = [i for i in items if not i.name.startswith(".") and i.name not in (
-                    "node_modules", "__pycache__", ".git", "venv", ".venv", "dist", "build",
-                    "target", ".pytest_cache", ".mypy_cache", "*.egg-info"
-                )]
+                # DirEntry carries the file type from the directory listing,
+                # so filtering, sorting and rendering don't stat each entry
+                with os.scandir(path) as it:
+                    items = [i for i in it if not i.name.startswith(".") and i.name not in (
+                        "node_modules", "__pycache__", ".git", "venv", ".venv", "dist", "build",
+                        "target", ".pytest_cache", ".mypy_cache", "*.egg-info"
+                    )]
+                items.sort(key=lambda x: (not x.is_dir(), x.name.lower()))
 
                 for i, item in enumerate(items[:30]):
                     is_last = i == len(items) - 1 or i == 29
                     connector = "└── " if is_last else "├── "
-                    tree_lines.append(f"{prefix}{connector}{item.name}{'/' if item.is_dir() else ''}")
+                    is_dir = item.is_dir()
+                    tree_lines.append(f"{prefix}{connector}{item.name}{'/' if is_dir else ''}")
 
-                    if item.is_dir():
+                    if is_dir:
                         extension = "    " if is_last else "│   "
-                        tree_lines.extend(get_tree(item, prefix + extension, current_depth + 1))
+                        tree_lines.extend(get_tree(Path(item.path), prefix + extension, current_depth + 1))
             except PermissionError:
                 pass
             return tree_lines
@@ -1058,46 +1117,7 @@ async def _handle_memory_overview(arguments: dict[str, Any]) -> list[TextContent
         # Instructions for Claude
         lines.append("# Instructions")
         lines.append("=" * 50)
-        lines.append("""
-Based on the documentation and structure above, analyze the project and create ONE comprehensive summary.
-
-Call glee.memory.add with:
-- category: "overview"
-- content: A comprehensive project summary covering:
-  - **Architecture**: Key patterns, module organization, data flow, entry points
-  - **Conventions**: Coding standards, naming patterns, file organization
-  - **Dependencies**: Key libraries and their purposes
-  - **Decisions**: Notable technical choices and trade-offs
-
-IMPORTANT:
-- Use category="overview" (not architecture, convention, etc.)
-- Write ONE comprehensive entry, not multiple scattered entries
-- This allows atomic refresh when the project evolves
-
-Example:
-glee.memory.add(category="overview", content=\"\"\"
-# Project Overview
-[Project name] is a [description].
-
-## Architecture
-- Entry point: src/main.py
-- CLI built with Typer
-- Data stored in SQLite + LanceDB
-
-## Conventions
-- snake_case for Python
-- Type hints required
-- Tests in tests/ directory
-
-## Key Dependencies
-- typer: CLI framework
-- lancedb: Vector storage
-
-## Technical Decisions
-- Using LanceDB for semantic search
-- MCP server for Claude Code integration
-\"\"\")
-""")
+        lines.append(_OVERVIEW_INSTRUCTIONS)
         return [TextContent(type="text", text="\n".join(lines))]
 
     # Read mode: return existing overview
@@ -1132,12 +1152,11 @@ glee.memory.add(category="overview", content=\"\"\"
 
 async def _handle_memory_stats() -> list[TextContent]:
     """Handle glee_memory_stats tool call."""
-    from glee.config import get_project_config
     from glee.memory import Memory
 
     config = get_project_config()
     if not config:
-        return [TextContent(type="text", text="Project not initialized. Run 'glee init' first.")]
+        return [_ERR_NOT_INITIALIZED]
 
     try:
         project_path = config.get("project", {}).get("path", ".")
@@ -1173,19 +1192,9 @@ async def _handle_memory_stats() -> list[TextContent]:
 
 async def _handle_task(arguments: dict[str, Any]) -> list[TextContent]:
     """Handle glee_task tool call - spawn an agent to execute a task."""
-    import asyncio
-    import concurrent.futures
-    import time
-    from pathlib import Path
-
-    # Import session module functions directly
-    import glee.agent_session as session_mod
-    from glee.agents import registry
-    from glee.config import get_project_config
-
     config = get_project_config()
     if not config:
-        return [TextContent(type="text", text="Project not initialized. Run 'glee init' first.")]
+        return [_ERR_NOT_INITIALIZED]
 
     project_path = Path(config.get("project", {}).get("path", "."))
 
@@ -1211,8 +1220,6 @@ async def _handle_task(arguments: dict[str, Any]) -> list[TextContent]:
     # 1. agent_name provided → use subagent definition from .glee/agents/
     # 2. agent_cli provided → run CLI directly
     # 3. Neither provided → auto-select based on heuristics
-    from glee.subagent import SubagentLoadError, load_subagent, render_prompt
-
     agent_cli: str  # CLI to use
     subagent_name: str | None = None  # For session tracking
     subagent_prompt: str | None = None  # Subagent system prompt
@@ -1294,9 +1301,6 @@ async def _handle_task(arguments: dict[str, Any]) -> list[TextContent]:
     # Run agent
     start_time = time.time()
 
-    # Get running event loop for thread-safe async calls
-    loop = asyncio.get_running_loop()
-
     def run_agent() -> tuple[str | None, str | None]:
         agent.project_path = project_path
         try:
@@ -1305,12 +1309,10 @@ async def _handle_task(arguments: dict[str, Any]) -> list[TextContent]:
                 return result.output, f"{result.error} (exit_code={result.exit_code})"
             return result.output, None
         except Exception as e:
-            import traceback
             return None, f"{str(e)}\n{traceback.format_exc()}"
 
-    # Run in thread to not block event loop
-    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-        output, error = await loop.run_in_executor(executor, run_agent)
+    # Run in the default executor to not block event loop
+    output, error = await asyncio.to_thread(run_agent)
 
     duration_ms = int((time.time() - start_time) * 1000)
 
@@ -1320,12 +1322,11 @@ async def _handle_task(arguments: dict[str, Any]) -> list[TextContent]:
         from glee.memory.capture import capture_memory
 
         capture_payload = capture_payload or {}
-        git_base_val = git_head(project_path)
+        git_base_val, changes, _ = git_status_snapshot(project_path)
         if git_base_val and "git_base" not in capture_payload:
             capture_payload["git_base"] = git_base_val
 
         if "recent_changes" not in capture_payload and "changes" not in capture_payload:
-            changes, _ = git_status_changes(project_path)
             if changes:
                 capture_payload["recent_changes"] = changes
 
@@ -1363,30 +1364,31 @@ async def _handle_task(arguments: dict[str, Any]) -> list[TextContent]:
     return [TextContent(type="text", text="\n".join(lines))]
 
 
-def _select_agent(prompt: str) -> str:
-    """Select the best agent based on prompt content using simple heuristics."""
-    from glee.agents import registry
-
-    prompt_lower = prompt.lower()
-
-    # Heuristics for agent selection
-    heuristics: dict[str, list[str]] = {
-        "gemini": [
+# Heuristics for agent selection: keyword alternations matched case-insensitively
+# as substrings, so the prompt is scanned once per agent without lowercasing it.
+_AGENT_HEURISTICS: list[tuple[str, re.Pattern[str]]] = [
+    (agent_name, re.compile("|".join(map(re.escape, keywords)), re.IGNORECASE))
+    for agent_name, keywords in (
+        ("gemini", (
             "search web", "google", "find online", "latest", "news",
             "research", "look up", "what is", "documentation", "search for",
-        ],
-        "codex": [
+        )),
+        ("codex", (
             "analyze code", "review", "find bugs", "refactor",
             "security", "performance", "fix", "debug", "code",
-        ],
-        "claude": [
+        )),
+        ("claude", (
             "summarize", "explain", "write", "draft", "quick",
             "simple", "help me understand",
-        ],
-    }
+        )),
+    )
+]
 
-    for agent_name, keywords in heuristics.items():
-        if any(kw in prompt_lower for kw in keywords):
+
+def _select_agent(prompt: str) -> str:
+    """Select the best agent based on prompt content using simple heuristics."""
+    for agent_name, pattern in _AGENT_HEURISTICS:
+        if pattern.search(prompt):
             agent = registry.get(agent_name)
             if agent and agent.is_available():
                 return agent_name
@@ -1404,7 +1406,6 @@ def _build_task_prompt(
     project_path: Path, session: Session, new_prompt: str
 ) -> str:
     """Build the full prompt with context injection."""
-    import glee.agent_session as session_mod
     from glee.memory import Memory
 
     lines: list[str] = []
@@ -1446,7 +1447,6 @@ def _build_task_prompt(
 
 async def _handle_review_status() -> list[TextContent]:
     """Handle glee.code_review.status tool call."""
-    from glee.config import get_project_config
     from glee.memory import Memory
 
     config = get_project_config()
@@ -1493,7 +1493,6 @@ async def _handle_review_status() -> list[TextContent]:
 
 async def _handle_review_get(arguments: dict[str, Any]) -> list[TextContent]:
     """Handle glee.code_review.get tool call."""
-    from glee.config import get_project_config
     from glee.memory import Memory
 
     review_id = arguments.get("review_id")
@@ -1562,6 +1561,19 @@ def _format_pr(pr: Any) -> str:
     )
 
 
+def _github_error(error: Exception, action: str) -> list[TextContent]:
+    """Build the error response shared by the GitHub handlers.
+
+    Must be called from the handler's except block. ValueError (e.g. no
+    GitHub token configured) is reported as is; anything else is logged with
+    its traceback and reported as "Error <action>: ...".
+    """
+    if isinstance(error, ValueError):
+        return [TextContent(type="text", text=f"Error: {error}")]
+    logger.exception(f"Error {action}")
+    return [TextContent(type="text", text=f"Error {action}: {error}")]
+
+
 def _format_pagination(pagination: dict[str, Any], current_page: int) -> str:
     """Format pagination info for display."""
     lines = ["\n--- Pagination ---"]
@@ -1577,12 +1589,10 @@ def _format_pagination(pagination: dict[str, Any], current_page: int) -> str:
 
 async def _handle_github_fetch_issues(arguments: dict[str, Any]) -> list[TextContent]:
     """Handle glee.github.fetch_issues tool call."""
-    from glee.github import GitHubClient
-
     owner = arguments.get("owner")
     repo = arguments.get("repo")
     if not owner or not repo:
-        return [TextContent(type="text", text="Error: owner and repo are required")]
+        return [_ERR_OWNER_REPO]
 
     state = arguments.get("state", "open")
     labels = arguments.get("labels")
@@ -1615,22 +1625,17 @@ async def _handle_github_fetch_issues(arguments: dict[str, Any]) -> list[TextCon
         lines.append(_format_pagination(pagination, page))
 
         return [TextContent(type="text", text="\n".join(lines))]
-    except ValueError as e:
-        return [TextContent(type="text", text=f"Error: {e}")]
     except Exception as e:
-        logger.exception("Error fetching issues")
-        return [TextContent(type="text", text=f"Error fetching issues: {e}")]
+        return _github_error(e, "fetching issues")
 
 
 async def _handle_github_fetch_issue(arguments: dict[str, Any]) -> list[TextContent]:
     """Handle glee.github.fetch_issue tool call."""
-    from glee.github import GitHubClient
-
     owner = arguments.get("owner")
     repo = arguments.get("repo")
     number = arguments.get("number")
     if not owner or not repo or not number:
-        return [TextContent(type="text", text="Error: owner, repo, and number are required")]
+        return [_ERR_OWNER_REPO_NUMBER]
 
     try:
         async with GitHubClient() as client:
@@ -1658,20 +1663,15 @@ async def _handle_github_fetch_issue(arguments: dict[str, Any]) -> list[TextCont
         lines.append(issue.body or "(no description)")
 
         return [TextContent(type="text", text="\n".join(lines))]
-    except ValueError as e:
-        return [TextContent(type="text", text=f"Error: {e}")]
     except Exception as e:
-        logger.exception("Error fetching issue")
-        return [TextContent(type="text", text=f"Error fetching issue: {e}")]
+        return _github_error(e, "fetching issue")
 
 
 async def _handle_github_search_issues(arguments: dict[str, Any]) -> list[TextContent]:
     """Handle glee.github.search_issues tool call."""
-    from glee.github import GitHubClient
-
     query = arguments.get("query")
     if not query:
-        return [TextContent(type="text", text="Error: query is required")]
+        return [_ERR_QUERY]
 
     owner = arguments.get("owner")
     repo = arguments.get("repo")
@@ -1705,21 +1705,16 @@ async def _handle_github_search_issues(arguments: dict[str, Any]) -> list[TextCo
             lines.append(_format_pagination(pagination, page))
 
         return [TextContent(type="text", text="\n".join(lines))]
-    except ValueError as e:
-        return [TextContent(type="text", text=f"Error: {e}")]
     except Exception as e:
-        logger.exception("Error searching issues")
-        return [TextContent(type="text", text=f"Error searching issues: {e}")]
+        return _github_error(e, "searching issues")
 
 
 async def _handle_github_fetch_prs(arguments: dict[str, Any]) -> list[TextContent]:
     """Handle glee.github.fetch_prs tool call."""
-    from glee.github import GitHubClient
-
     owner = arguments.get("owner")
     repo = arguments.get("repo")
     if not owner or not repo:
-        return [TextContent(type="text", text="Error: owner and repo are required")]
+        return [_ERR_OWNER_REPO]
 
     state = arguments.get("state", "open")
     sort = arguments.get("sort", "created")
@@ -1750,22 +1745,17 @@ async def _handle_github_fetch_prs(arguments: dict[str, Any]) -> list[TextConten
         lines.append(_format_pagination(pagination, page))
 
         return [TextContent(type="text", text="\n".join(lines))]
-    except ValueError as e:
-        return [TextContent(type="text", text=f"Error: {e}")]
     except Exception as e:
-        logger.exception("Error fetching PRs")
-        return [TextContent(type="text", text=f"Error fetching PRs: {e}")]
+        return _github_error(e, "fetching PRs")
 
 
 async def _handle_github_fetch_pr(arguments: dict[str, Any]) -> list[TextContent]:
     """Handle glee.github.fetch_pr tool call."""
-    from glee.github import GitHubClient
-
     owner = arguments.get("owner")
     repo = arguments.get("repo")
     number = arguments.get("number")
     if not owner or not repo or not number:
-        return [TextContent(type="text", text="Error: owner, repo, and number are required")]
+        return [_ERR_OWNER_REPO_NUMBER]
 
     try:
         async with GitHubClient() as client:
@@ -1785,20 +1775,15 @@ async def _handle_github_fetch_pr(arguments: dict[str, Any]) -> list[TextContent
         ]
 
         return [TextContent(type="text", text="\n".join(lines))]
-    except ValueError as e:
-        return [TextContent(type="text", text=f"Error: {e}")]
     except Exception as e:
-        logger.exception("Error fetching PR")
-        return [TextContent(type="text", text=f"Error fetching PR: {e}")]
+        return _github_error(e, "fetching PR")
 
 
 async def _handle_github_search_prs(arguments: dict[str, Any]) -> list[TextContent]:
     """Handle glee.github.search_prs tool call."""
-    from glee.github import GitHubClient
-
     query = arguments.get("query")
     if not query:
-        return [TextContent(type="text", text="Error: query is required")]
+        return [_ERR_QUERY]
 
     owner = arguments.get("owner")
     repo = arguments.get("repo")
@@ -1832,22 +1817,17 @@ async def _handle_github_search_prs(arguments: dict[str, Any]) -> list[TextConte
             lines.append(_format_pagination(pagination, page))
 
         return [TextContent(type="text", text="\n".join(lines))]
-    except ValueError as e:
-        return [TextContent(type="text", text=f"Error: {e}")]
     except Exception as e:
-        logger.exception("Error searching PRs")
-        return [TextContent(type="text", text=f"Error searching PRs: {e}")]
+        return _github_error(e, "searching PRs")
 
 
 async def _handle_github_merge_pr(arguments: dict[str, Any]) -> list[TextContent]:
     """Handle glee.github.merge_pr tool call."""
-    from glee.github import GitHubClient
-
     owner = arguments.get("owner")
     repo = arguments.get("repo")
     number = arguments.get("number")
     if not owner or not repo or not number:
-        return [TextContent(type="text", text="Error: owner, repo, and number are required")]
+        return [_ERR_OWNER_REPO_NUMBER]
 
     confirm = arguments.get("confirm", False)
     merge_method = arguments.get("merge_method", "merge")
@@ -1899,11 +1879,8 @@ async def _handle_github_merge_pr(arguments: dict[str, Any]) -> list[TextContent
             ]
             return [TextContent(type="text", text="\n".join(lines))]
 
-    except ValueError as e:
-        return [TextContent(type="text", text=f"Error: {e}")]
     except Exception as e:
-        logger.exception("Error merging PR")
-        return [TextContent(type="text", text=f"Error merging PR: {e}")]
+        return _github_error(e, "merging PR")
 
 
 async def run_server():
@@ -87,29 +87,18 @@ def capture_memory(
                 cleared[category] = memory.clear(category)
             if not values:
                 return
-            count = 0
-            for item in values:
-                if not item:
-                    continue
-                meta = dict(meta_base)
-                if extra_meta:
-                    meta.update(extra_meta)
-                memory.add(category=category, content=item, metadata=meta)
-                count += 1
+            # Entries in one call share metadata; merge it once, not per item
+            meta = {**meta_base, **extra_meta} if extra_meta else meta_base
+            # One embedding pass and one write per category
+            count = len(memory.add_many([(category, item, meta) for item in values if item]))
             if count:
                 added[category] = added.get(category, 0) + count
 
             # Prune old entries if max_keep is set (for append-mode categories)
             if max_keep is not None and not clear_first:
-                entries = memory.get_by_category(category)
-                if len(entries) > max_keep:
-                    # Entries are returned oldest first, delete the oldest
-                    to_delete = entries[:-max_keep]
-                    for entry in to_delete:
-                        entry_id = entry.get("id")
-                        if entry_id:
-                            memory.delete(entry_id)
-                            cleared[category] = cleared.get(category, 0) + 1
+                pruned = memory.prune(category, max_keep)
+                if pruned:
+                    cleared[category] = cleared.get(category, 0) + pruned
 
         goal_present, goal_value = _get_payload_value(payload, ["goal", "current_goal", "objective"])
         if goal_present:
@@ -1,15 +1,17 @@
 """Memory store combining LanceDB (vector) and DuckDB (SQL)."""
 
-import json
+import functools
 import re
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any
 
 import duckdb
 import lancedb
+import orjson
+import pyarrow as pa
 from fastembed import TextEmbedding
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 from glee.db.duckdb import init_duckdb
 
@@ -17,16 +19,36 @@ from glee.db.duckdb import init_duckdb
 _CATEGORY_PATTERN = re.compile(r"^[a-zA-Z0-9_-]+$")
 _MEMORY_ID_PATTERN = re.compile(r"^[a-f0-9]{8}$")
 
-# Singleton embedding model (expensive to load, share across Memory instances)
-_shared_embedder: TextEmbedding | None = None
+# Embedding model used for memory vectors
+EMBEDDING_MODEL = "BAAI/bge-small-en-v1.5"
+EMBEDDING_DIM = 384
 
+# LanceDB table holding memory vectors
+_LANCE_TABLE = "memories"
 
-def _get_embedder() -> TextEmbedding:
-    """Get or create the shared embedding model singleton."""
-    global _shared_embedder
-    if _shared_embedder is None:
-        _shared_embedder = TextEmbedding(model_name="BAAI/bge-small-en-v1.5")
-    return _shared_embedder
+# Arrow schema of the LanceDB memories table (what LanceDB infers from rows)
+_LANCE_SCHEMA: Any = pa.schema([  # type: ignore[reportUnknownMemberType]
+    ("id", pa.string()),  # type: ignore[reportUnknownMemberType]
+    ("category", pa.string()),  # type: ignore[reportUnknownMemberType]
+    ("content", pa.string()),  # type: ignore[reportUnknownMemberType]
+    ("vector", pa.list_(pa.float32(), EMBEDDING_DIM)),  # type: ignore[reportUnknownMemberType]
+])
+
+
+@functools.cache
+def _get_embedder(model_name: str = EMBEDDING_MODEL) -> TextEmbedding:
+    """Get the shared embedding model (expensive to load, one per model per process)."""
+    return TextEmbedding(model_name=model_name)
+
+
+@functools.lru_cache(maxsize=1024)
+def _embed_cached(model_name: str, text: str) -> tuple[float, ...]:
+    """Embed a single text, memoised per model (~1.5MB at 384 dims).
+
+    Repeated queries (search-then-add flows, re-run reviews) skip the model pass.
+    """
+    embedding = next(iter(_get_embedder(model_name).embed([text])))
+    return tuple(embedding.tolist())
 
 
 def _validate_category(category: str) -> str:
@@ -75,7 +97,7 @@ class MemoryEntry(BaseModel):
     category: str  # architecture, convention, review, decision
     content: str
     metadata: dict[str, Any] = {}
-    created_at: datetime = datetime.now()
+    created_at: datetime = Field(default_factory=datetime.now)
 
 
 class Memory:
@@ -89,12 +111,13 @@ class Memory:
 
         # Initialize databases
         self._lance_db: lancedb.DBConnection | None = None
+        self._lance_table: lancedb.table.Table | None = None
         self._duck_conn: duckdb.DuckDBPyConnection | None = None
 
     @property
     def embedder(self) -> TextEmbedding:
-        """Get shared embedding model singleton."""
-        return _get_embedder()
+        """Get shared embedding model."""
+        return _get_embedder(EMBEDDING_MODEL)
 
     @property
     def lance(self) -> lancedb.DBConnection:
@@ -103,6 +126,19 @@ class Memory:
             self._lance_db = lancedb.connect(str(self.lance_path))
         return self._lance_db
 
+    def _open_table(self) -> lancedb.table.Table | None:
+        """Get the LanceDB memories table, or None if it doesn't exist yet.
+
+        The handle is kept for the life of this instance, so the table
+        manifest is read once rather than on every add/search/delete.
+        """
+        if self._lance_table is None:
+            try:
+                self._lance_table = self.lance.open_table(_LANCE_TABLE)
+            except Exception:
+                return None
+        return self._lance_table
+
     @property
     def duck(self) -> duckdb.DuckDBPyConnection:
         """Get DuckDB connection."""
@@ -117,9 +153,12 @@ class Memory:
             init_duckdb(self._duck_conn, tables=["memories", "stats"])
 
     def _embed(self, text: str) -> list[float]:
-        """Generate embedding for text."""
-        embeddings = list(self.embedder.embed([text]))
-        return embeddings[0].tolist()
+        """Generate embedding for text (cached per text)."""
+        return list(_embed_cached(EMBEDDING_MODEL, text))
+
+    def _embed_batch(self, texts: list[str]) -> list[list[float]]:
+        """Generate embeddings for many texts in one model pass."""
+        return [e.tolist() for e in self.embedder.embed(texts)]
 
     def add(
         self,
@@ -137,39 +176,80 @@ class Memory:
         Returns:
             The memory ID
         """
+        return self.add_many([(category, content, metadata)])[0]
+
+    def add_many(
+        self,
+        entries: list[tuple[str, str, dict[str, Any] | None]],
+    ) -> list[str]:
+        """Add several memory entries at once.
+
+        Embeds all contents in one batch, inserts into DuckDB in a single
+        transaction and appends to LanceDB with a single write.
+
+        Args:
+            entries: (category, content, metadata) tuples
+
+        Returns:
+            The memory IDs, in input order
+        """
         import uuid
 
-        memory_id = str(uuid.uuid4())[:8]
+        if not entries:
+            return []
+
+        # One clock read per batch, but each row gets its own microsecond
+        # offset: readers order by created_at alone, so rows sharing a
+        # timestamp would come back in arbitrary order
         now = datetime.now()
+        memory_ids = [str(uuid.uuid4())[:8] for _ in entries]
 
         # Store in DuckDB (structured)
-        self.duck.execute(
-            """
-            INSERT INTO memories (id, category, content, metadata, created_at)
-            VALUES (?, ?, ?, ?, ?)
-            """,
-            [memory_id, category, content, json.dumps(metadata or {}), now],
-        )
+        rows = [
+            [
+                memory_id,
+                category,
+                content,
+                orjson.dumps(metadata or {}, option=orjson.OPT_NON_STR_KEYS).decode(),
+                now + timedelta(microseconds=i),
+            ]
+            for i, (memory_id, (category, content, metadata)) in enumerate(zip(memory_ids, entries))
+        ]
+        self.duck.begin()
+        try:
+            self.duck.executemany(
+                """
+                INSERT INTO memories (id, category, content, metadata, created_at)
+                VALUES (?, ?, ?, ?, ?)
+                """,
+                rows,
+            )
+            self.duck.commit()
+        except Exception:
+            self.duck.rollback()
+            raise
 
         # Store in LanceDB (vector)
-        vector = self._embed(content)
-        table_name = "memories"
+        vectors = self._embed_batch([content for _, content, _ in entries])
 
-        data = [{
-            "id": memory_id,
-            "category": category,
-            "content": content,
-            "vector": vector,
-        }]
+        columns = {
+            "id": memory_ids,
+            "category": [category for category, _, _ in entries],
+            "content": [content for _, content, _ in entries],
+            "vector": vectors,
+        }
 
-        try:
-            table = self.lance.open_table(table_name)
-            table.add(data)  # type: ignore[reportUnknownMemberType]
-        except Exception:
+        # Columnar Arrow batch with an explicit schema: no per-row dict
+        # conversion or type inference on LanceDB's side
+        table = self._open_table()
+        if table is not None:
+            table.add(pa.RecordBatch.from_pydict(columns, schema=table.schema))  # type: ignore[reportUnknownMemberType]
+        else:
             # Table doesn't exist, create it
-            self.lance.create_table(table_name, data)  # type: ignore[reportUnknownMemberType]
+            batch: Any = pa.RecordBatch.from_pydict(columns, schema=_LANCE_SCHEMA)  # type: ignore[reportUnknownMemberType]
+            self._lance_table = self.lance.create_table(_LANCE_TABLE, batch)  # type: ignore[reportUnknownMemberType]
 
-        return memory_id
+        return memory_ids
 
     def search(
         self,
@@ -187,30 +267,53 @@ class Memory:
         Returns:
             List of matching memories
         """
-        try:
-            table = self.lance.open_table("memories")
-        except Exception:
+        table = self._open_table()
+        if table is None:
             return []
 
         vector = self._embed(query)
-        results = table.search(vector).limit(limit)  # type: ignore[reportUnknownMemberType]
+        results = table.search(vector)  # type: ignore[reportUnknownMemberType]
 
+        # Filter before the ANN limit so a category search still returns up to `limit` rows
         if category:
             validated_category = _validate_category(category)
-            results = results.where(f"category = '{validated_category}'")
+            results = results.where(f"category = '{validated_category}'", prefilter=True)
 
-        return list(results.to_list())  # type: ignore[reportUnknownMemberType]
+        return list(results.limit(limit).to_list())  # type: ignore[reportUnknownMemberType]
 
-    def get_by_category(self, category: str) -> list[dict[str, Any]]:
-        """Get all memories in a category."""
-        result = self.duck.execute(
-            "SELECT * FROM memories WHERE category = ? ORDER BY created_at DESC",
-            [category],
-        ).fetchall()
+    def get_by_category(self, category: str, limit: int | None = None) -> list[dict[str, Any]]:
+        """Get memories in a category, newest first.
+
+        Args:
+            category: Category to fetch
+            limit: Optional max number of entries (applied in SQL)
+        """
+        query = "SELECT * FROM memories WHERE category = ? ORDER BY created_at DESC"
+        params: list[Any] = [category]
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+        result = self.duck.execute(query, params).fetchall()
 
         columns = ["id", "category", "content", "metadata", "created_at"]
         return [dict(zip(columns, row)) for row in result]
 
+    def get_content_by_category(self, category: str, limit: int) -> list[str]:
+        """Get just the content of the newest memories in a category.
+
+        Cheaper than get_by_category when only the text is needed: metadata
+        is neither read nor converted.
+
+        Args:
+            category: Category to fetch
+            limit: Max number of entries
+        """
+        result = self.duck.execute(
+            "SELECT content FROM memories WHERE category = ? ORDER BY created_at DESC LIMIT ?",
+            [category, limit],
+        ).fetchall()
+        return [row[0] for row in result]
+
     def get_categories(self) -> list[str]:
         """Get all unique categories."""
         result = self.duck.execute(
@@ -228,18 +331,32 @@ class Memory:
         """
         lines: list[str] = []
 
-        # Get all categories dynamically
-        categories = self.get_categories()
+        # One query for all categories: the window keeps only the newest
+        # max_per_category rows of each, so the rest are never fetched
+        rows = self.duck.execute(
+            """
+            SELECT category, content FROM (
+                SELECT category, content,
+                       row_number() OVER (PARTITION BY category ORDER BY created_at DESC) AS rn
+                FROM memories
+            )
+            WHERE rn <= ?
+            ORDER BY category, rn
+            """,
+            [max_per_category],
+        ).fetchall()
+
+        by_category: dict[str, list[str]] = {}
+        for category, content in rows:
+            by_category.setdefault(category, []).append(content)
 
-        for category in categories:
-            memories = self.get_by_category(category)
-            if memories:
-                # Format category name: "my-category" -> "My Category"
-                title = category.replace("-", " ").replace("_", " ").title()
-                lines.append(f"### {title}")
-                for m in memories[:max_per_category]:
-                    lines.append(f"- {m['content']}")
-                lines.append("")
+        for category, contents in by_category.items():
+            # Format category name: "my-category" -> "My Category"
+            title = category.replace("-", " ").replace("_", " ").title()
+            lines.append(f"### {title}")
+            for content in contents:
+                lines.append(f"- {content}")
+            lines.append("")
 
         return "\n".join(lines)
 
@@ -266,8 +383,9 @@ class Memory:
         # Delete from LanceDB (validate to prevent injection)
         try:
             validated_id = _validate_memory_id(memory_id)
-            table = self.lance.open_table("memories")
-            table.delete(f"id = '{validated_id}'")  # type: ignore[reportUnknownMemberType]
+            table = self._open_table()
+            if table is not None:
+                table.delete(f"id = '{validated_id}'")  # type: ignore[reportUnknownMemberType]
         except ValueError:
             pass  # Invalid ID format, skip LanceDB deletion
         except Exception:
@@ -275,6 +393,40 @@ class Memory:
 
         return True
 
+    def prune(self, category: str, keep: int) -> int:
+        """Delete all but the newest `keep` memories in a category.
+
+        Args:
+            category: Category to prune
+            keep: Number of most recent entries to keep
+
+        Returns:
+            Number of memories deleted
+        """
+        rows = self.duck.execute(
+            "SELECT id FROM memories WHERE category = ? ORDER BY created_at DESC OFFSET ?",
+            [category, keep],
+        ).fetchall()
+        ids: list[str] = [row[0] for row in rows]
+        if not ids:
+            return 0
+
+        # Delete from DuckDB
+        self.duck.execute("DELETE FROM memories WHERE list_contains(?, id)", [ids])
+
+        # Delete from LanceDB (validate to prevent injection)
+        try:
+            id_list = ", ".join(f"'{_validate_memory_id(memory_id)}'" for memory_id in ids)
+            table = self._open_table()
+            if table is not None:
+                table.delete(f"id IN ({id_list})")  # type: ignore[reportUnknownMemberType]
+        except ValueError:
+            pass  # Invalid ID format, skip LanceDB deletion
+        except Exception:
+            pass  # Table might not exist
+
+        return len(ids)
+
     def clear(self, category: str | None = None) -> int:
         """Clear memories.
 
@@ -297,8 +449,9 @@ class Memory:
             # Delete from LanceDB (validate to prevent injection)
             try:
                 validated_category = _validate_category(category)
-                table = self.lance.open_table("memories")
-                table.delete(f"category = '{validated_category}'")  # type: ignore[reportUnknownMemberType]
+                table = self._open_table()
+                if table is not None:
+                    table.delete(f"category = '{validated_category}'")  # type: ignore[reportUnknownMemberType]
             except ValueError:
                 pass  # Invalid category format, skip LanceDB deletion
             except Exception:
@@ -311,9 +464,10 @@ class Memory:
             # Delete all from DuckDB
             self.duck.execute("DELETE FROM memories")
 
-            # Drop and recreate LanceDB table
+            # Drop LanceDB table (recreated by the next add)
+            self._lance_table = None
             try:
-                self.lance.drop_table("memories")
+                self.lance.drop_table(_LANCE_TABLE)
             except Exception:
                 pass
 
@@ -382,4 +536,5 @@ class Memory:
         if self._duck_conn:
             self._duck_conn.close()
             self._duck_conn = None
+        self._lance_table = None
         self._lance_db = None
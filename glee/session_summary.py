@@ -7,8 +7,7 @@ from typing import Any
 
 from glee.helpers import (
     git_diff_since,
-    git_head,
-    git_status_changes,
+    git_status_snapshot,
     parse_metadata,
 )
 from glee.memory.capture import capture_memory
@@ -51,25 +50,24 @@ def summarize_session(
     effective_session_id = claude_session_id or session_id
 
     memory = Memory(str(project_path))
-    session_summaries = memory.get_by_category("session_summary")
+    # Newest first: only the latest summary's git_base is needed
+    session_summaries = memory.get_by_category("session_summary", limit=1)
     memory.close()
 
     git_base: str | None = None
     if session_summaries:
-        # Use [-1] to get the latest session summary (appended, not cleared)
-        meta = parse_metadata(session_summaries[-1].get("metadata"))
+        meta = parse_metadata(session_summaries[0].get("metadata"))
         git_base = meta.get("git_base")
 
-    changes: list[str] = []
-    changes_available = False
+    # One git call for HEAD plus the working-tree fallback changes
+    head, changes, changes_available = git_status_snapshot(project_path)
     if git_base:
-        changes, changes_available = git_diff_since(project_path, git_base)
-    if not changes_available:
-        changes, changes_available = git_status_changes(project_path)
+        diff_changes, diff_available = git_diff_since(project_path, git_base)
+        if diff_available:
+            changes, changes_available = diff_changes, True
 
     payload: dict[str, Any] = {"summary": summary_text}
 
-    head = git_head(project_path)
     if head:
         payload["git_base"] = head
 
@@ -4,12 +4,16 @@ Loads subagent definitions from .glee/agents/*.yml and prepares
 them for execution.
 """
 
+import os
 import re
 from pathlib import Path
 from typing import Any, TypedDict
 
 import yaml
 
+# ${var} placeholders in a subagent prompt
+_PROMPT_VAR_RE = re.compile(r"\$\{(\w+)\}")
+
 
 class SubagentInput(TypedDict, total=False):
     """Input parameter definition for a subagent."""
@@ -57,11 +61,12 @@ def get_agents_dir(project_path: str | Path) -> Path:
 def list_subagents(project_path: str | Path) -> list[str]:
     """List available subagent names."""
     agents_dir = get_agents_dir(project_path)
-    if not agents_dir.exists():
+    try:
+        with os.scandir(agents_dir) as it:
+            return [e.name.removesuffix(".yml") for e in it if e.name.endswith(".yml") and e.is_file()]
+    except OSError:
         return []
 
-    return [f.stem for f in agents_dir.glob("*.yml") if f.is_file()]
-
 
 def load_subagent(project_path: str | Path, name: str) -> Subagent:
     """Load a subagent definition from .glee/agents/{name}.yml.
@@ -160,7 +165,7 @@ def render_prompt(
         # Return original if no value found
         return match.group(0)
 
-    system_prompt = re.sub(r"\$\{(\w+)\}", replace_var, system_prompt)
+    system_prompt = _PROMPT_VAR_RE.sub(replace_var, system_prompt)
 
     # Combine system prompt with user prompt
     full_prompt = f"""<subagent_instructions>
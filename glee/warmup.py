@@ -3,11 +3,12 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
+from itertools import islice
 from pathlib import Path
 
 from glee.helpers import git_diff_since, git_status_changes, parse_metadata, parse_time
 from glee.memory import Memory
-from glee.agent_session import load_all_sessions
+from glee.agent_session import load_session_index
 
 # Days after which overview memory is considered stale
 BOOTSTRAP_STALE_DAYS = 7
@@ -30,7 +31,7 @@ def build_warmup_text(project_path: str | Path) -> str | None:
         "overview",
     }
 
-    sessions = load_all_sessions(project_path)
+    sessions = load_session_index(project_path)
 
     if sessions:
         last = sessions[0]  # Already sorted by updated_at, newest first
@@ -46,7 +47,7 @@ def build_warmup_text(project_path: str | Path) -> str | None:
     memory = Memory(str(project_path))
     try:
         # Bootstrap context (project overview)
-        overview_entries = memory.get_by_category("overview")
+        overview_entries = memory.get_by_category("overview", limit=1)
         if overview_entries:
             entry = overview_entries[0]  # Should be a single comprehensive entry
             content = (entry.get("content") or "").strip()
@@ -66,23 +67,25 @@ def build_warmup_text(project_path: str | Path) -> str | None:
 
                 sections.append(f"## Project Context\n{content}{stale_warning}")
 
-        goal_entries = memory.get_by_category("goal")
-        constraint_entries = memory.get_by_category("constraint")
-        decision_entries = memory.get_by_category("decision")
-        open_loop_entries = memory.get_by_category("open_loop")
-        recent_change_entries = memory.get_by_category("recent_change")
-        session_summaries = memory.get_by_category("session_summary")
+        # Only the content is needed (and only the first few) for these
+        goal_entries = memory.get_content_by_category("goal", 1)
+        constraint_entries = memory.get_content_by_category("constraint", 5)
+        decision_entries = memory.get_content_by_category("decision", 3)
+        open_loop_entries = memory.get_content_by_category("open_loop", 5)
+        recent_change_entries = memory.get_content_by_category("recent_change", 10)
+        # Newest first: only the latest summary's git_base is needed
+        session_summaries = memory.get_by_category("session_summary", limit=1)
         categories = memory.get_categories()
 
         if goal_entries:
-            goal = (goal_entries[0].get("content") or "").strip()
+            goal = (goal_entries[0] or "").strip()
             if goal:
                 sections.append("## Current Goal\n" + goal)
 
         if constraint_entries:
             lines = ["## Key Constraints"]
-            for entry in constraint_entries[:5]:
-                content = (entry.get("content") or "").strip()
+            for content in constraint_entries:
+                content = (content or "").strip()
                 if content:
                     lines.append(f"- {content}")
             if len(lines) > 1:
@@ -90,8 +93,8 @@ def build_warmup_text(project_path: str | Path) -> str | None:
 
         if decision_entries:
             lines = ["## Recent Decisions"]
-            for entry in decision_entries[:3]:
-                content = (entry.get("content") or "").strip()
+            for content in decision_entries:
+                content = (content or "").strip()
                 if content:
                     lines.append(f"- {content}")
             if len(lines) > 1:
@@ -99,17 +102,12 @@ def build_warmup_text(project_path: str | Path) -> str | None:
 
         git_base: str | None = None
         if session_summaries:
-            # Use [-1] to get the latest session summary (appended, not cleared)
-            meta = parse_metadata(session_summaries[-1].get("metadata"))
+            meta = parse_metadata(session_summaries[0].get("metadata"))
             git_base = meta.get("git_base")
 
         recent_changes, _ = git_diff_since(project_path, git_base, limit=10) if git_base else ([], False)
         if not recent_changes and recent_change_entries:
-            recent_changes = [
-                entry.get("content", "").strip()
-                for entry in recent_change_entries[:10]
-                if entry.get("content")
-            ]
+            recent_changes = [content.strip() for content in recent_change_entries if content]
         if not recent_changes:
             recent_changes, _ = git_status_changes(project_path, limit=10)
 
@@ -121,17 +119,18 @@ def build_warmup_text(project_path: str | Path) -> str | None:
 
         if open_loop_entries:
             lines = ["## Open Loops"]
-            for entry in open_loop_entries[:5]:
-                content = (entry.get("content") or "").strip()
+            for content in open_loop_entries:
+                content = (content or "").strip()
                 if content:
                     lines.append(f"- {content}")
             if len(lines) > 1:
                 sections.append("\n".join(lines))
         elif sessions:
-            open_loops = [s for s in sessions if s.get("status") in {"active", "error"}]
+            # Stop at the first five matches instead of filtering every session
+            open_loops = list(islice((s for s in sessions if s.get("status") in {"active", "error"}), 5))
             if open_loops:
                 lines = ["## Open Loops"]
-                for s in open_loops[:5]:
+                for s in open_loops:
                     desc = (s.get("description") or "").strip() or s.get("session_id", "unknown")
                     status = s.get("status", "unknown")
                     lines.append(f"- {s.get('session_id', 'unknown')} ({status}): {desc}")
@@ -141,11 +140,11 @@ def build_warmup_text(project_path: str | Path) -> str | None:
         if extra_categories:
             lines = ["## Memory"]
             for cat in extra_categories:
-                entries = memory.get_by_category(cat)
+                entries = memory.get_content_by_category(cat, 5)
                 title = cat.replace("-", " ").replace("_", " ").title()
                 lines.append(f"### {title}")
-                for entry in entries[:5]:
-                    content = (entry.get("content") or "").strip()
+                for content in entries:
+                    content = (content or "").strip()
                     if content:
                         lines.append(f"- {content}")
                 lines.append("")
@@ -0,0 +1,224 @@
+"""Tests for agent session storage."""
+
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import orjson
+import pytest
+
+from glee import agent_session
+from glee.agent_session import (
+    Session,
+    add_message,
+    complete_session,
+    create_session,
+    load_session,
+    load_session_index,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> Generator[Path, None, None]:
+    """Temp project with an empty in-process session cache."""
+    (tmp_path / ".glee").mkdir()
+    agent_session._session_cache.clear()
+    yield tmp_path
+    agent_session._session_cache.clear()
+
+
+def _reload(project: Path, session_id: str) -> Session | None:
+    """Load a session from disk, bypassing the in-process cache."""
+    agent_session._session_cache.clear()
+    return load_session(project, session_id)
+
+
+def _paths(project: Path, session_id: str) -> tuple[Path, Path]:
+    sessions_dir = project / ".glee" / "agent_sessions"
+    return sessions_dir / f"{session_id}.json", sessions_dir / f"{session_id}.journal"
+
+
+class TestJournal:
+    """Tests for the append-only session journal."""
+
+    def test_messages_append_to_journal_not_session_file(self, project: Path):
+        session = create_session(project, "desc", "codex", "first")
+        session_file, journal = _paths(project, session["session_id"])
+        base = session_file.read_bytes()
+
+        add_message(project, session["session_id"], "user", "second")
+        complete_session(project, session["session_id"], "answer")
+
+        assert session_file.read_bytes() == base
+        assert len(journal.read_bytes().splitlines()) == 2
+
+        loaded = _reload(project, session["session_id"])
+        assert loaded is not None
+        assert [m["content"] for m in loaded["messages"]] == ["first", "second", "answer"]
+        assert loaded["status"] == "completed"
+
+    def test_compaction_folds_journal_into_session_file(self, project: Path):
+        session = create_session(project, "desc", "codex", "first")
+        session_id = session["session_id"]
+        session_file, journal = _paths(project, session_id)
+
+        for i in range(20):
+            add_message(project, session_id, "user", f"message {i} " + "x" * 50)
+
+        # Compacted at least once: the session file holds more than the first message
+        assert session_file.read_bytes().count(b'"role"') > 1
+        assert not journal.exists() or journal.stat().st_size < session_file.stat().st_size
+
+        loaded = _reload(project, session_id)
+        assert loaded is not None
+        assert len(loaded["messages"]) == 21
+        assert loaded["messages"][-1]["content"].startswith("message 19 ")
+
+    def test_replay_over_compacted_session_file_is_idempotent(self, project: Path):
+        session = create_session(project, "desc", "codex", "first")
+        session_id = session["session_id"]
+        _, journal = _paths(project, session_id)
+
+        add_message(project, session_id, "user", "second")
+        complete_session(project, session_id, "answer")
+        stale_journal = journal.read_bytes()
+
+        # Compact, then put the journal back as a reader racing the unlink sees it
+        loaded = _reload(project, session_id)
+        assert loaded is not None
+        agent_session.save_session(project, loaded)
+        assert not journal.exists()
+        journal.write_bytes(stale_journal)
+
+        replayed = _reload(project, session_id)
+        assert replayed is not None
+        assert [m["content"] for m in replayed["messages"]] == ["first", "second", "answer"]
+
+    def test_torn_line_does_not_swallow_next_event(self, project: Path):
+        session = create_session(project, "desc", "codex", "first")
+        session_id = session["session_id"]
+        _, journal = _paths(project, session_id)
+
+        add_message(project, session_id, "user", "second")
+        # Interrupted append: a partial event with no trailing newline
+        with open(journal, "ab") as f:
+            f.write(b'{"index": 2, "message": {"role": "us')
+
+        add_message(project, session_id, "user", "third")
+
+        loaded = _reload(project, session_id)
+        assert loaded is not None
+        assert [m["content"] for m in loaded["messages"]] == ["first", "second", "third"]
+
+
+class TestAtomicWrite:
+    """Tests for atomic session file writes."""
+
+    def test_concurrent_saves_from_threads(self, project: Path):
+        session = create_session(project, "desc", "codex", "first")
+        session_file, _ = _paths(project, session["session_id"])
+        errors: list[BaseException] = []
+
+        def save_many(n: int) -> None:
+            try:
+                for i in range(50):
+                    copy = agent_session.load_session(project, session["session_id"])
+                    assert copy is not None
+                    copy["description"] = f"writer {n} pass {i}"
+                    agent_session.save_session(project, copy)
+            except BaseException as e:  # pragma: no cover - reported below
+                errors.append(e)
+
+        threads = [threading.Thread(target=save_many, args=(n,)) for n in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert errors == []
+        loaded = _reload(project, session["session_id"])
+        assert loaded is not None
+        assert loaded["description"].startswith("writer ")
+        assert [p.name for p in session_file.parent.iterdir() if p.suffix == ".tmp"] == []
+
+
+class TestSessionIndex:
+    """Tests for the sidecar session index."""
+
+    def test_index_is_built_from_headers(self, project: Path):
+        first = create_session(project, "first", "codex", "hello")
+        second = create_session(project, "second", "codex", "hello")
+
+        headers = load_session_index(project)
+
+        assert {h["session_id"] for h in headers} == {first["session_id"], second["session_id"]}
+        assert all("messages" not in h for h in headers)
+        index_file = project / ".glee" / "agent_sessions" / ".index.json"
+        assert index_file.exists()
+        assert b"hello" not in index_file.read_bytes()
+
+    def test_save_session_makes_index_stale(self, project: Path):
+        session = create_session(project, "before", "codex", "hello")
+        load_session_index(project)
+
+        session["description"] = "after"
+        agent_session.save_session(project, session)
+
+        (header,) = load_session_index(project)
+        assert header["description"] == "after"
+        assert header["updated_at"] == session["updated_at"]
+
+    def test_external_rewrite_is_picked_up(self, project: Path):
+        session = create_session(project, "before", "codex", "hello")
+        load_session_index(project)
+        session_file, _ = _paths(project, session["session_id"])
+
+        data = orjson.loads(session_file.read_bytes())
+        data["description"] = "edited elsewhere, and longer"
+        session_file.write_bytes(orjson.dumps(data))
+
+        (header,) = load_session_index(project)
+        assert header["description"] == "edited elsewhere, and longer"
+
+    @pytest.mark.parametrize("content", [b"{not json", b"[1, 2]", b'{"x": 1}'])
+    def test_corrupt_index_is_rebuilt(self, project: Path, content: bytes):
+        session = create_session(project, "desc", "codex", "hello")
+        index_file = project / ".glee" / "agent_sessions" / ".index.json"
+        index_file.write_bytes(content)
+
+        (header,) = load_session_index(project)
+
+        assert header["session_id"] == session["session_id"]
+        assert session["session_id"] in orjson.loads(index_file.read_bytes())
+
+
+class TestSessionCache:
+    """Tests for the in-process session cache."""
+
+    def test_concurrent_loads_with_eviction(self, project: Path, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr(agent_session, "_SESSION_CACHE_SIZE", 2)
+        session_ids = [create_session(project, f"s{i}", "codex", "hi")["session_id"] for i in range(8)]
+        errors: list[BaseException] = []
+
+        def load_many(offset: int) -> None:
+            try:
+                for i in range(400):
+                    session_id = session_ids[(i + offset) % len(session_ids)]
+                    loaded = load_session(project, session_id)
+                    assert loaded is not None and loaded["session_id"] == session_id
+            except BaseException as e:  # pragma: no cover - reported below
+                errors.append(e)
+
+        threads = [threading.Thread(target=load_many, args=(n,)) for n in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert errors == []
+        assert len(agent_session._session_cache) <= 2
@@ -0,0 +1,34 @@
+"""Tests for reading Claude Code session files."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from glee.claude_session import (
+    get_claude_projects_dir,
+    get_claude_session_file,
+    project_path_to_claude_folder,
+)
+
+
+class TestSessionLookup:
+    """Tests for locating session files under the home directory."""
+
+    def test_projects_dir_follows_home(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setenv("HOME", str(tmp_path))
+
+        assert get_claude_projects_dir() == tmp_path / ".claude" / "projects"
+
+    def test_session_file_found_under_current_home(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        home = tmp_path / "home"
+        project = tmp_path / "project"
+        project.mkdir()
+        folder = home / ".claude" / "projects" / project_path_to_claude_folder(project)
+        folder.mkdir(parents=True)
+        (folder / "abc.jsonl").write_text("{}\n")
+        monkeypatch.setattr(Path, "home", classmethod(lambda cls: home))
+
+        assert get_claude_session_file(project, "abc") == folder / "abc.jsonl"
+        assert get_claude_session_file(project, "missing") is None
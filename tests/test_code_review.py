@@ -0,0 +1,75 @@
+"""Tests for the code review command helpers."""
+
+from __future__ import annotations
+
+import subprocess
+from typing import Any
+
+import pytest
+
+from glee.cli.code_review import _get_repo_info, _parse_github_target
+
+
+class TestParseGithubTarget:
+    """Tests for _parse_github_target."""
+
+    @pytest.mark.parametrize(
+        ("target", "expected"),
+        [
+            ("github:pr#123", ("pr", None, None, 123)),
+            ("github:#7", ("pr", None, None, 7)),
+            ("github:42", ("pr", None, None, 42)),
+            ("github:owner/repo#123", ("pr", "owner", "repo", 123)),
+            ("github:my-org/my.repo#9", ("pr", "my-org", "my.repo", 9)),
+            ("github:branch/feature", ("branch", None, None, "feature")),
+            ("github:branch/feature/nested", ("branch", None, None, "feature/nested")),
+        ],
+    )
+    def test_valid_targets(self, target: str, expected: tuple[Any, ...]):
+        assert _parse_github_target(target) == expected
+
+    @pytest.mark.parametrize("target", ["github:", "github:pr", "github:branch/", "git:changes", "src/"])
+    def test_invalid_targets(self, target: str):
+        with pytest.raises(ValueError, match="Invalid GitHub target"):
+            _parse_github_target(target)
+
+
+class TestGetRepoInfo:
+    """Tests for parsing the origin remote URL."""
+
+    def _remote(self, monkeypatch: pytest.MonkeyPatch, url: str, returncode: int = 0) -> None:
+        def run(*args: Any, **kwargs: Any) -> subprocess.CompletedProcess[str]:
+            return subprocess.CompletedProcess(args, returncode, stdout=f"{url}\n", stderr="")
+
+        monkeypatch.setattr(subprocess, "run", run)
+
+    @pytest.mark.parametrize(
+        "url",
+        [
+            "git@github.com:owner/repo.git",
+            "git@github.com:owner/repo",
+            "https://github.com/owner/repo.git",
+            "https://github.com/owner/repo",
+        ],
+    )
+    def test_github_urls(self, monkeypatch: pytest.MonkeyPatch, url: str):
+        self._remote(monkeypatch, url)
+
+        assert _get_repo_info() == ("owner", "repo")
+
+    def test_repo_name_with_dots(self, monkeypatch: pytest.MonkeyPatch):
+        self._remote(monkeypatch, "git@github.com:owner/my.repo.git")
+
+        assert _get_repo_info() == ("owner", "my.repo")
+
+    def test_non_github_url(self, monkeypatch: pytest.MonkeyPatch):
+        self._remote(monkeypatch, "https://gitlab.com/owner/repo.git")
+
+        with pytest.raises(ValueError, match="Could not parse GitHub URL"):
+            _get_repo_info()
+
+    def test_no_origin_remote(self, monkeypatch: pytest.MonkeyPatch):
+        self._remote(monkeypatch, "", returncode=2)
+
+        with pytest.raises(ValueError, match="Could not get git remote URL"):
+            _get_repo_info()
@@ -0,0 +1,82 @@
+"""Tests for the Codex agent's output parsing."""
+
+from __future__ import annotations
+
+import orjson
+import pytest
+
+from glee.agents.codex import CodexAgent, _iter_lines_reversed
+
+
+def _jsonl(*items: object) -> str:
+    return "\n".join(orjson.dumps(item).decode() for item in items)
+
+
+def _completed(text: str) -> dict[str, object]:
+    return {"type": "item.completed", "item": {"type": "agent_message", "text": text}}
+
+
+class TestIterLinesReversed:
+    """Tests for _iter_lines_reversed."""
+
+    @pytest.mark.parametrize("text", ["", "\n", "\n\n  \n", "   "])
+    def test_no_lines(self, text: str):
+        assert list(_iter_lines_reversed(text)) == []
+
+    def test_with_and_without_trailing_newline(self):
+        assert list(_iter_lines_reversed("a\nb\nc")) == ["c", "b", "a"]
+        assert list(_iter_lines_reversed("a\nb\nc\n")) == ["c", "b", "a"]
+
+    def test_skips_blank_lines_and_strips(self):
+        assert list(_iter_lines_reversed("\n  a  \n\n\r\nb\r\n")) == ["b", "a"]
+
+    def test_multibyte_characters(self):
+        assert list(_iter_lines_reversed("première\n日本語\n🙂 fin")) == ["🙂 fin", "日本語", "première"]
+
+    def test_single_line(self):
+        assert list(_iter_lines_reversed("only")) == ["only"]
+
+    def test_is_lazy(self):
+        lines = _iter_lines_reversed("first\n" + "x\n" * 10_000 + "last")
+
+        assert next(lines) == "last"
+
+
+class TestFinalMessage:
+    """Tests for CodexAgent._final_message."""
+
+    @pytest.fixture
+    def agent(self) -> CodexAgent:
+        return CodexAgent()
+
+    def test_last_agent_message_wins(self, agent: CodexAgent):
+        output = _jsonl(_completed("first"), {"type": "turn.started"}, _completed("final"))
+
+        assert agent._final_message(output) == "final"
+
+    def test_trailing_noise_is_skipped(self, agent: CodexAgent):
+        output = _jsonl(_completed("final"), {"type": "turn.completed"}) + "\nnot json\n[1, 2]\n\n"
+
+        assert agent._final_message(output) == "final"
+
+    def test_direct_message_type(self, agent: CodexAgent):
+        output = _jsonl(_completed("older"), {"type": "message", "content": "newer"})
+
+        assert agent._final_message(output) == "newer"
+
+    def test_non_message_items_are_ignored(self, agent: CodexAgent):
+        output = _jsonl(
+            _completed("answer"),
+            {"type": "item.completed", "item": {"type": "reasoning", "text": "thinking"}},
+            {"type": "item.completed", "item": "not an object"},
+            {"type": "item.completed", "item": {"type": "agent_message", "text": ""}},
+        )
+
+        assert agent._final_message(output) == "answer"
+
+    def test_multibyte_message_without_trailing_newline(self, agent: CodexAgent):
+        assert agent._final_message(_jsonl(_completed("résumé 完了 ✅"))) == "résumé 完了 ✅"
+
+    @pytest.mark.parametrize("output", ["", "plain text output", _jsonl({"type": "turn.started"})])
+    def test_no_message(self, agent: CodexAgent, output: str):
+        assert agent._final_message(output) is None
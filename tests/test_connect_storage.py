@@ -152,6 +152,17 @@ class TestAIProviderOAuthCredential:
         )
         assert not cred.is_expired()
 
+    def test_is_expired_with_explicit_now(self) -> None:
+        cred = AIProviderOAuthCredential(
+            id="test",
+            label="codex",
+            sdk="openai",
+            vendor="openai",
+            expires=5000,
+        )
+        assert not cred.is_expired(4000)
+        assert cred.is_expired(6000)
+
     def test_to_dict(self) -> None:
         cred = AIProviderOAuthCredential(
             id="oauth123",
@@ -315,6 +326,67 @@ class TestStorageFunctions:
         assert storage.ConnectionStorage.update("nonexistent", cred) is False
 
 
+class TestReadCache:
+    """Tests for the mtime-validated parse cache."""
+
+    def test_read_returns_copy(self, temp_auth_file: Path) -> None:
+        storage.ConnectionStorage.add(AIProviderAPICredential(
+            id="", label="cached", sdk="openai", vendor="test", key="key"
+        ))
+        data = storage.ConnectionStorage.read()
+        data.append({"id": "bogus"})
+        data[0]["label"] = "mutated"
+        assert len(storage.ConnectionStorage.read()) == 1
+        assert storage.ConnectionStorage.read()[0]["label"] == "cached"
+        assert storage.ConnectionStorage.get("cached") is not None
+
+    def test_get_skips_entries_that_do_not_parse(self, temp_auth_file: Path) -> None:
+        temp_auth_file.write_text(
+            '[{"id": "abc", "label": "dup", "type": "future_type"},'
+            ' {"id": "def", "label": "dup", "type": "ai_api", "vendor": "test", "key": "k"}]'
+        )
+        cred = storage.ConnectionStorage.get("dup")
+        assert cred is not None
+        assert cred.id == "def"
+        assert storage.ConnectionStorage.get("abc") is None
+
+    def test_external_edit_invalidates(self, temp_auth_file: Path) -> None:
+        storage.ConnectionStorage.add(AIProviderAPICredential(
+            id="", label="first", sdk="openai", vendor="test", key="key"
+        ))
+        assert len(storage.ConnectionStorage.all()) == 1
+
+        # Simulate another process rewriting the file
+        temp_auth_file.write_text(
+            "- id: abc\n  label: other\n  type: ai_api\n  vendor: test\n  key: k\n"
+            "- id: def\n  label: more\n  type: ai_api\n  vendor: test\n  key: k\n"
+        )
+        labels = [c.label for c in storage.ConnectionStorage.all()]
+        assert labels == ["other", "more"]
+
+    def test_malformed_entries_are_skipped(self, temp_auth_file: Path) -> None:
+        temp_auth_file.write_text(
+            '[{"id": "abc", "label": "ok", "type": "ai_api", "vendor": "test", "key": "k"}, "junk", 3, null]'
+        )
+        assert [e["label"] for e in storage.ConnectionStorage.read()] == ["ok"]
+        assert storage.ConnectionStorage.get("abc") is not None
+
+        temp_auth_file.write_text('{"not": "a list"}')
+        assert storage.ConnectionStorage.read() == []
+
+    def test_written_as_json_and_yaml_compatible(self, temp_auth_file: Path) -> None:
+        import json
+
+        import yaml
+
+        storage.ConnectionStorage.add(AIProviderAPICredential(
+            id="", label="json", sdk="openai", vendor="test", key="key"
+        ))
+        text = temp_auth_file.read_text()
+        assert json.loads(text)[0]["label"] == "json"
+        assert yaml.safe_load(text)[0]["label"] == "json"
+
+
 class TestGenerateId:
     """Tests for ID generation."""
 
@@ -0,0 +1,153 @@
+"""Tests for shared helper functions."""
+
+from __future__ import annotations
+
+import shutil
+import subprocess
+from pathlib import Path
+
+import orjson
+import pytest
+
+from glee.helpers import extract_json_object, git_status_snapshot, parse_focus
+
+
+def _git(repo: Path, *args: str) -> str:
+    result = subprocess.run(
+        ["git", "-c", "user.name=Test", "-c", "user.email=test@example.com", *args],
+        cwd=repo,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return result.stdout.strip()
+
+
+@pytest.fixture
+def repo(tmp_path: Path) -> Path:
+    """Empty git repository (no commits yet)."""
+    if shutil.which("git") is None:
+        pytest.skip("git not installed")
+    _git(tmp_path, "init", "-q")
+    return tmp_path
+
+
+def _commit(repo: Path, *files: str) -> str:
+    for name in files:
+        (repo / name).write_text(f"{name}\n")
+    _git(repo, "add", "-A")
+    _git(repo, "commit", "-q", "-m", "commit")
+    return _git(repo, "rev-parse", "HEAD")
+
+
+class TestParseFocus:
+    """Tests for parse_focus."""
+
+    @pytest.mark.parametrize("value", [None, "", ",", " , ,, "])
+    def test_empty(self, value: str | None):
+        assert parse_focus(value) is None
+
+    def test_splits_on_commas_and_strips_whitespace(self):
+        assert parse_focus(" security ,performance,  tests ") == ["security", "performance", "tests"]
+
+    def test_drops_blanks_and_duplicates_in_order(self):
+        assert parse_focus("tests,,security, tests ,security,style") == ["tests", "security", "style"]
+
+
+class TestExtractJsonObject:
+    """Tests for extract_json_object."""
+
+    def test_fenced_json(self):
+        text = 'Result:\n```json\n{"verdict": "approve", "issues": []}\n```\nDone.'
+
+        assert extract_json_object(text) == '{"verdict": "approve", "issues": []}'
+
+    def test_leading_and_trailing_prose(self):
+        text = 'Here is the review. {"a": 1} Let me know if you need more.'
+
+        assert extract_json_object(text) == '{"a": 1}'
+
+    def test_nested_braces(self):
+        obj = '{"a": {"b": {"c": [1, {"d": 2}]}}, "e": {}}'
+
+        assert extract_json_object(f"prefix {obj} suffix {{}}") == obj
+
+    def test_braces_and_escaped_quotes_inside_strings(self):
+        obj = r'{"code": "if (x) { return \"}\"; }", "n": 1}'
+
+        result = extract_json_object(f"text {obj} more")
+
+        assert result == obj
+        assert result is not None and orjson.loads(result)["n"] == 1
+
+    def test_first_object_wins(self):
+        assert extract_json_object('{"first": 1} and {"second": 2}') == '{"first": 1}'
+
+    @pytest.mark.parametrize("text", ["", "no json here", "[1, 2, 3]", '{"unterminated": {"x": 1}'])
+    def test_no_json_object(self, text: str):
+        assert extract_json_object(text) is None
+
+
+class TestGitStatusSnapshot:
+    """Tests for git_status_snapshot."""
+
+    def test_clean_repo_reports_head(self, repo: Path):
+        head = _commit(repo, "a.txt")
+
+        assert git_status_snapshot(repo) == (head, [], True)
+
+    def test_before_first_commit(self, repo: Path):
+        (repo / "new.txt").write_text("x")
+
+        assert git_status_snapshot(repo) == (None, ["?? new.txt"], True)
+
+    def test_outside_a_repository(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        # Stop git from finding a repository above tmp_path
+        monkeypatch.setenv("GIT_CEILING_DIRECTORIES", str(tmp_path))
+
+        assert git_status_snapshot(tmp_path) == (None, [], False)
+
+    def test_untracked_and_modified(self, repo: Path):
+        _commit(repo, "a.txt")
+        (repo / "a.txt").write_text("changed\n")
+        (repo / "b.txt").write_text("new\n")
+
+        _, changes, _ = git_status_snapshot(repo)
+
+        assert changes == [" M a.txt", "?? b.txt"]
+
+    def test_staged_and_unstaged(self, repo: Path):
+        _commit(repo, "a.txt")
+        (repo / "a.txt").write_text("staged\n")
+        _git(repo, "add", "a.txt")
+        (repo / "a.txt").write_text("staged, then edited\n")
+        (repo / "c.txt").write_text("added\n")
+        _git(repo, "add", "c.txt")
+
+        _, changes, _ = git_status_snapshot(repo)
+
+        assert changes == ["MM a.txt", "A  c.txt"]
+
+    def test_rename(self, repo: Path):
+        _commit(repo, "old.txt")
+        _git(repo, "mv", "old.txt", "new.txt")
+
+        _, changes, _ = git_status_snapshot(repo)
+
+        assert changes == ["R  old.txt -> new.txt"]
+
+    def test_paths_with_spaces_are_verbatim(self, repo: Path):
+        _commit(repo, "my file.txt")
+        _git(repo, "mv", "my file.txt", "your file.txt")
+        (repo / "a b.txt").write_text("x")
+
+        _, changes, _ = git_status_snapshot(repo)
+
+        assert changes == ["R  my file.txt -> your file.txt", "?? a b.txt"]
+
+    def test_limit(self, repo: Path):
+        head = _commit(repo, "a.txt")
+        for i in range(5):
+            (repo / f"new{i}.txt").write_text("x")
+
+        assert git_status_snapshot(repo, limit=2) == (head, ["?? new0.txt", "?? new1.txt"], True)
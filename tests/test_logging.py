@@ -0,0 +1,268 @@
+"""Tests for SQLite log storage."""
+
+from __future__ import annotations
+
+import sqlite3
+from datetime import datetime, timezone
+from pathlib import Path
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from glee.db.sqlite import close_thread_connections, get_sqlite_connection, get_sqlite_path, init_sqlite
+from glee.logging import SQLiteLogHandler, query_logs
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
+
+def _message(text: str, level: str = "INFO", time: datetime | None = None) -> Any:
+    """Stand-in for the loguru message passed to a sink."""
+    return SimpleNamespace(
+        record={
+            "time": time or datetime.now().astimezone(),
+            "level": SimpleNamespace(name=level),
+            "message": text,
+        }
+    )
+
+
+def _messages(project: Path) -> list[str]:
+    rows = get_sqlite_connection(project).execute("SELECT message FROM logs ORDER BY id").fetchall()
+    return [row[0] for row in rows]
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> Generator[Path, None, None]:
+    """Temp project; closes this thread's connections afterwards."""
+    (tmp_path / ".glee").mkdir()
+    yield tmp_path
+    close_thread_connections()
+
+
+@pytest.fixture
+def handler(project: Path) -> Generator[SQLiteLogHandler, None, None]:
+    h = SQLiteLogHandler(project)
+    yield h
+    h.close()
+
+
+class TestSQLiteLogHandler:
+    """Tests for the background writer thread."""
+
+    def test_write_is_queued_and_flush_commits(self, project: Path, handler: SQLiteLogHandler):
+        handler.write(_message("hello"))
+        handler.flush()
+
+        assert _messages(project) == ["hello"]
+
+    def test_records_are_inserted_in_batches(
+        self, project: Path, handler: SQLiteLogHandler, monkeypatch: pytest.MonkeyPatch
+    ):
+        sizes: list[int] = []
+        insert_batch = SQLiteLogHandler._insert_batch
+
+        def record_size(self: SQLiteLogHandler, conn: Any, cursor: Any, batch: list[Any]) -> None:
+            sizes.append(len(batch))
+            insert_batch(self, conn, cursor, batch)
+
+        monkeypatch.setattr(SQLiteLogHandler, "_insert_batch", record_size)
+        count = SQLiteLogHandler._BATCH_SIZE * 2 + 10
+        for i in range(count):
+            handler.write(_message(f"m{i}"))
+        handler.flush()
+
+        assert sum(sizes) == count
+        assert len(sizes) < count
+        assert max(sizes) <= SQLiteLogHandler._BATCH_SIZE
+        assert _messages(project) == [f"m{i}" for i in range(count)]
+
+    def test_close_flushes_and_stops_writer(self, project: Path):
+        handler = SQLiteLogHandler(project)
+        for i in range(10):
+            handler.write(_message(f"m{i}"))
+
+        handler.close()
+
+        assert not handler._thread.is_alive()
+        assert _messages(project) == [f"m{i}" for i in range(10)]
+
+    def test_writer_survives_failing_batch(
+        self, project: Path, handler: SQLiteLogHandler, capsys: pytest.CaptureFixture[str]
+    ):
+        conn = get_sqlite_connection(project)
+        conn.execute("DROP TABLE logs")
+        conn.commit()
+
+        handler.write(_message("dropped"))
+        handler.flush()
+        err = capsys.readouterr().err
+        assert "failed to write 1 log record" in err
+        assert "no such table: logs" in err
+
+        init_sqlite(conn, tables=["logs"])
+        handler.write(_message("kept"))
+        handler.flush()
+
+        assert handler._thread.is_alive()
+        assert _messages(project) == ["kept"]
+
+    def test_sync_write_reports_database_errors(
+        self, project: Path, handler: SQLiteLogHandler, capsys: pytest.CaptureFixture[str]
+    ):
+        handler.close()
+        conn = get_sqlite_connection(project)
+        conn.execute("DROP TABLE logs")
+        conn.commit()
+
+        handler.write(_message("late"))
+
+        assert "failed to write 1 log record" in capsys.readouterr().err
+
+    def test_write_after_writer_stopped_is_synchronous(self, project: Path, handler: SQLiteLogHandler):
+        handler.close()
+
+        handler.write(_message("late"))
+
+        assert _messages(project) == ["late"]
+
+    def test_flush_drains_queue_of_dead_writer(self, project: Path, handler: SQLiteLogHandler):
+        handler.close()
+        # Records that reached the queue just before the writer went away
+        handler._queue.put((1, "INFO", "orphan"))
+
+        handler.flush()
+
+        assert _messages(project) == ["orphan"]
+
+
+class TestTimestampMigration:
+    """Tests for converting legacy ISO-8601 log timestamps."""
+
+    LEGACY_ROWS = [
+        ("2024-03-01T12:00:00.250000+02:00", "INFO", "east"),
+        ("2024-03-01T09:30:00-01:00", "INFO", "west"),
+        ("2024-03-01T10:15:00.500+00:00", "ERROR", "utc"),
+    ]
+
+    @pytest.fixture
+    def legacy_db(self, project: Path) -> Path:
+        """A logs table as written by versions that stored TEXT timestamps."""
+        conn = sqlite3.connect(get_sqlite_path(project))
+        conn.execute(
+            "CREATE TABLE logs (id INTEGER PRIMARY KEY AUTOINCREMENT,"
+            " timestamp TEXT NOT NULL, level TEXT NOT NULL, message TEXT NOT NULL)"
+        )
+        conn.execute("CREATE INDEX idx_logs_timestamp ON logs(timestamp)")
+        conn.executemany("INSERT INTO logs (timestamp, level, message) VALUES (?, ?, ?)", self.LEGACY_ROWS)
+        conn.commit()
+        conn.close()
+        return project
+
+    def test_first_connection_migrates_to_epoch_us(self, legacy_db: Path):
+        conn = get_sqlite_connection(legacy_db)
+
+        types = {row[1]: row[2] for row in conn.execute("PRAGMA table_info(logs)")}
+        assert types["timestamp"] == "INTEGER"
+        rows = dict(conn.execute("SELECT message, timestamp FROM logs").fetchall())
+        assert rows == {
+            "east": int(datetime(2024, 3, 1, 10, 0, 0, 250000, timezone.utc).timestamp() * 1_000_000),
+            "west": int(datetime(2024, 3, 1, 10, 30, 0, tzinfo=timezone.utc).timestamp() * 1_000_000),
+            "utc": int(datetime(2024, 3, 1, 10, 15, 0, 500000, timezone.utc).timestamp() * 1_000_000),
+        }
+        indexes = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+        assert "idx_logs_timestamp" in indexes
+
+    def test_since_until_filter_migrated_rows(self, legacy_db: Path):
+        since = datetime(2024, 3, 1, 10, 10, tzinfo=timezone.utc)
+        until = datetime(2024, 3, 1, 10, 20, tzinfo=timezone.utc)
+
+        assert [r["message"] for r in query_logs(legacy_db, since=since)] == ["west", "utc"]
+        assert [r["message"] for r in query_logs(legacy_db, until=until)] == ["utc", "east"]
+        (row,) = query_logs(legacy_db, since=since, until=until)
+        assert row["message"] == "utc"
+        assert datetime.fromisoformat(row["timestamp"]) == datetime(
+            2024, 3, 1, 10, 15, 0, 500000, timezone.utc
+        )
+
+    def test_migrated_table_accepts_new_records(self, legacy_db: Path):
+        handler = SQLiteLogHandler(legacy_db)
+        handler.write(_message("new"))
+        handler.close()
+
+        assert _messages(legacy_db) == ["east", "west", "utc", "new"]
+
+
+class TestSearch:
+    """Tests for query_logs substring search (trigram FTS with a LIKE fallback)."""
+
+    @pytest.fixture
+    def logged(self, project: Path, handler: SQLiteLogHandler) -> SQLiteLogHandler:
+        for text in ["100% done", "1000 done", "a_b", "axb", "abc", "xab"]:
+            handler.write(_message(text))
+        handler.flush()
+        return handler
+
+    @staticmethod
+    def _search(project: Path, term: str) -> set[str]:
+        return {r["message"] for r in query_logs(project, search=term)}
+
+    def test_fts_search(self, project: Path, logged: SQLiteLogHandler):
+        assert self._search(project, "done") == {"100% done", "1000 done"}
+        assert self._search(project, "0% d") == {"100% done"}
+
+    def test_short_search_falls_back_to_like(self, project: Path, logged: SQLiteLogHandler):
+        # Too short for a trigram: FTS would match nothing
+        assert self._search(project, "ab") == {"abc", "xab"}
+        assert self._search(project, "x") == {"axb", "xab"}
+
+    def test_like_escapes_wildcards(self, project: Path, logged: SQLiteLogHandler):
+        assert self._search(project, "%") == {"100% done"}
+        assert self._search(project, "_b") == {"a_b"}
+
+    def test_like_fallback_without_fts_table(self, project: Path, logged: SQLiteLogHandler):
+        conn = get_sqlite_connection(project)
+        conn.execute("DROP TABLE logs_fts")
+        conn.commit()
+
+        assert self._search(project, "0% d") == {"100% done"}
+        assert self._search(project, "a_b") == {"a_b"}
+
+    def test_prefix_is_case_insensitive_and_literal(self, project: Path, logged: SQLiteLogHandler):
+        def prefixed(text: str) -> set[str]:
+            return {r["message"] for r in query_logs(project, prefix=text)}
+
+        assert prefixed("AB") == {"abc"}
+        assert prefixed("100") == {"100% done", "1000 done"}
+        assert prefixed("100%") == {"100% done"}
+        assert prefixed("a_") == {"a_b"}
+        assert {r["message"] for r in query_logs(project, prefix="x", search="b")} == {"xab"}
+
+    def test_legacy_prefix_index_is_dropped(self, project: Path):
+        conn = get_sqlite_connection(project)
+        conn.execute("CREATE TABLE logs (id INTEGER PRIMARY KEY, timestamp INTEGER, level TEXT, message TEXT)")
+        conn.execute("CREATE INDEX idx_logs_message_prefix ON logs(message COLLATE NOCASE)")
+        conn.commit()
+
+        SQLiteLogHandler(project).close()
+
+        conn = get_sqlite_connection(project)
+        indexes = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+        assert "idx_logs_message_prefix" not in indexes
+
+    def test_triggers_keep_fts_in_sync_after_rotation(self, project: Path, logged: SQLiteLogHandler):
+        logged._settings["max_general_logs"] = 3
+        logged._rotate_logs()
+
+        conn = get_sqlite_connection(project)
+        # Raises if the index disagrees with the logs table
+        conn.execute("INSERT INTO logs_fts(logs_fts) VALUES ('integrity-check')")
+        conn.commit()
+        assert _messages(project) == ["axb", "abc", "xab"]
+        assert self._search(project, "done") == set()
+        assert self._search(project, "abc") == {"abc"}
+
+        logged.write(_message("fresh abc"))
+        logged.flush()
+        assert self._search(project, "abc") == {"abc", "fresh abc"}
@@ -0,0 +1,66 @@
+"""Tests for MCP tool handlers."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from glee import mcp_server
+
+
+class _Agent:
+    def __init__(self, available: bool):
+        self._available = available
+
+    def is_available(self) -> bool:
+        return self._available
+
+
+@pytest.fixture
+def agents(monkeypatch: pytest.MonkeyPatch) -> None:
+    available = {"codex": True, "claude": False}
+    monkeypatch.setattr(
+        mcp_server.registry, "get", lambda name: _Agent(available[name]) if name in available else None
+    )
+
+
+class TestHandleStatus:
+    """Tests for the glee_status response text."""
+
+    async def test_not_configured(self, agents: None, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr(mcp_server, "get_project_config", lambda: None)
+
+        (content,) = await mcp_server._handle_status()
+
+        assert content.text == "\n".join([
+            "Glee Status",
+            "=" * 40,
+            "",
+            "CLI Availability:",
+            "  codex: found",
+            "  claude: not found",
+            "  gemini: not found",
+            "",
+            "Current directory: not configured",
+            "Run 'glee init' to initialize.",
+        ])
+
+    async def test_configured(self, agents: None, monkeypatch: pytest.MonkeyPatch):
+        config: dict[str, Any] = {
+            "project": {"name": "demo"},
+            "reviewers": {"primary": "claude", "secondary": "codex"},
+        }
+        monkeypatch.setattr(mcp_server, "get_project_config", lambda: config)
+
+        (content,) = await mcp_server._handle_status()
+
+        assert content.text.endswith("\n".join([
+            "",
+            "Project: demo",
+            "",
+            "Reviewers:",
+            "  Primary: claude",
+            "  Secondary: codex",
+        ]))
+        assert not content.text.endswith("\n")
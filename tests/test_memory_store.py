@@ -0,0 +1,109 @@
+"""Tests for the memory store."""
+
+from __future__ import annotations
+
+import importlib.util
+import sys
+import types
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+
+if importlib.util.find_spec("fastembed") is None:
+    # Embeddings are stubbed in the fixture; the store only needs the import
+    _fastembed = types.ModuleType("fastembed")
+    _fastembed.TextEmbedding = object  # type: ignore[attr-defined]
+    sys.modules["fastembed"] = _fastembed
+
+from glee.memory import capture_memory
+from glee.memory.store import EMBEDDING_DIM, Memory
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
+
+@pytest.fixture
+def memory(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Generator[Memory, None, None]:
+    """Memory store in a temp project, with embeddings stubbed out."""
+    (tmp_path / ".glee").mkdir()
+    monkeypatch.setattr(
+        Memory, "_embed_batch", lambda self, texts: [[0.0] * EMBEDDING_DIM for _ in texts]
+    )
+    monkeypatch.setattr(Memory, "_embed", lambda self, text: [0.0] * EMBEDDING_DIM)
+    mem = Memory(tmp_path)
+    yield mem
+    mem.close()
+
+
+class TestAddMany:
+    """Tests for batched inserts."""
+
+    def test_batch_rows_get_distinct_increasing_timestamps(self, memory: Memory):
+        memory.add_many([("decision", f"d{i}", None) for i in range(5)])
+
+        rows = memory.duck.execute(
+            "SELECT content, created_at FROM memories ORDER BY created_at"
+        ).fetchall()
+        assert [content for content, _ in rows] == ["d0", "d1", "d2", "d3", "d4"]
+        assert len({created_at for _, created_at in rows}) == 5
+
+    def test_newest_batch_items_come_first(self, memory: Memory):
+        memory.add_many([("decision", f"d{i}", None) for i in range(5)])
+
+        assert memory.get_content_by_category("decision", 3) == ["d4", "d3", "d2"]
+        assert [e["content"] for e in memory.get_by_category("decision")] == [
+            "d4", "d3", "d2", "d1", "d0",
+        ]
+        assert memory.get_context(max_per_category=3).count("- d") == 3
+        assert "- d4\n- d3\n- d2" in memory.get_context(max_per_category=3)
+
+
+class TestPrune:
+    """Tests for pruning a category down to its newest entries."""
+
+    def test_keeps_newest_entries(self, memory: Memory):
+        memory.add_many([("decision", f"d{i}", None) for i in range(5)])
+        for i in range(5, 8):
+            memory.add("decision", f"d{i}")
+        memory.add("goal", "unrelated")
+
+        assert memory.prune("decision", 3) == 5
+
+        assert memory.get_content_by_category("decision", 10) == ["d7", "d6", "d5"]
+        assert memory.get_content_by_category("goal", 10) == ["unrelated"]
+        table = memory._open_table()
+        assert table is not None
+        assert table.count_rows() == 4
+
+    def test_capture_keeps_newest_appended_entries(self, memory: Memory, tmp_path: Path):
+        for run in range(4):
+            capture_memory(str(tmp_path), {"decisions": [f"r{run}d{i}" for i in range(5)]})
+
+        kept = memory.get_content_by_category("decision", 100)
+        expected = [f"r{run}d{i}" for run in range(4) for i in range(5)][-15:]
+        assert kept == expected[::-1]
+
+    def test_nothing_to_prune(self, memory: Memory):
+        memory.add_many([("decision", f"d{i}", None) for i in range(3)])
+
+        assert memory.prune("decision", 3) == 0
+        assert memory.get_content_by_category("decision", 10) == ["d2", "d1", "d0"]
+
+
+class TestSearch:
+    """Tests for semantic search."""
+
+    def test_category_filter_applies_before_limit(self, memory: Memory, monkeypatch: pytest.MonkeyPatch):
+        def vector(text: str) -> list[float]:
+            # "near" texts sit on the query; everything else is far away
+            return [1.0 if text.startswith("near") else -1.0] + [0.0] * (EMBEDDING_DIM - 1)
+
+        monkeypatch.setattr(memory, "_embed_batch", lambda texts: [vector(t) for t in texts])
+        monkeypatch.setattr(memory, "_embed", vector)
+        memory.add_many([("decision", f"near {i}", None) for i in range(10)])
+        memory.add_many([("goal", f"far {i}", None) for i in range(3)])
+
+        results = memory.search("near query", category="goal", limit=3)
+
+        assert sorted(r["content"] for r in results) == ["far 0", "far 1", "far 2"]